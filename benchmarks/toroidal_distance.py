@@ -0,0 +1,57 @@
+"""
+Compare the per-point scalar wrapped distance with the vectorized kernel.
+
+Run from the repository root:
+    python -m benchmarks.toroidal_distance [num_points]
+"""
+import math
+import sys
+import timeit
+from typing import List
+
+import numpy as np
+
+from src.app.constants import MAP_WIDTH, MAP_HEIGHT
+from src.app.helpers import Helpers
+
+
+def scalar_projected(origin: List[float], targets: List[List[float]]) -> List[float]:
+    """
+    The previous implementation: nine projections per target, minimum picked in Python.
+    """
+    distances = []
+    for target in targets:
+        options = []
+        for x_sign in [1, 0, -1]:
+            for y_sign in [1, 0, -1]:
+                projected = [target[0] + MAP_WIDTH * x_sign, target[1] + MAP_HEIGHT * y_sign]
+                to_target = [projected[0] - origin[0], projected[1] - origin[1]]
+                options.append((to_target, math.hypot(to_target[0], to_target[1])))
+        distances.append(min(options, key=lambda item: item[1])[1])
+    return distances
+
+
+def main(num_points: int = 10_000, repeat: int = 5) -> None:
+    rng = np.random.default_rng(0)
+    points = rng.random((num_points, 2)) * [MAP_WIDTH, MAP_HEIGHT]
+    origin = [MAP_WIDTH / 3, MAP_HEIGHT / 3]
+    targets = points.tolist()
+
+    expected = np.array(scalar_projected(origin, targets))
+    assert np.allclose(Helpers.wrapped_distances(origin, points), expected)
+
+    cases = {
+        "scalar nine projections": lambda: scalar_projected(origin, targets),
+        "scalar unwrapped_to": lambda: [Helpers.unwrapped_to(origin, t) for t in targets],
+        "vectorized wrapped_distances": lambda: Helpers.wrapped_distances(origin, points),
+    }
+    print(f"{num_points} points, best of {repeat}:")
+    baseline = None
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        baseline = baseline or best
+        print(f"  {name:32} {best * 1e3:9.3f} ms  ({baseline / best:7.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
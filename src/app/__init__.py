@@ -1,15 +1,23 @@
+from typing import Optional
+
 from flask import Flask
 from src.app.routes.helper_backend import palantiri
 from src.app.routes.original_backend import control, objective, observation, reset, announcements, beacon, get_image, \
-    daily_map
+    daily_map, simulation, submit_img_obj  # noqa: F401 (submit_img_obj registers on the get_image blueprint)
+from src.app.sim_engine import sim_engine, lockstep_from_env
 
 
-def create_app() -> Flask:
+def create_app(lockstep: Optional[bool] = None) -> Flask:
     """
     Create and configure the Flask application.
 
-    This function initializes the Flask app and registers all the required blueprints
-    for routing different parts of the application.
+    This function initializes the Flask app, registers all the required blueprints
+    for routing different parts of the application and starts the simulation.
+
+    Args:
+        lockstep (Optional[bool]): Advance the simulation only through explicit steps
+            (POST /palantiri/step or `sim_engine.step`) instead of the wall clock.
+            Defaults to the PALANTIRI_LOCKSTEP environment variable.
 
     Returns:
         Flask: The configured Flask application instance.
@@ -25,5 +33,8 @@ def create_app() -> Flask:
     app.register_blueprint(get_image.bp)
     app.register_blueprint(daily_map.bp)
     app.register_blueprint(objective.bp)
+    app.register_blueprint(simulation.bp)
+
+    sim_engine.start(lockstep=lockstep_from_env() if lockstep is None else lockstep)
 
     return app
@@ -0,0 +1,109 @@
+import os
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.app.broadcaster import Broadcaster, OverflowPolicy
+from src.app.constants import BEACON_MAX_DETECT_RANGE, MAP_WIDTH, MAP_HEIGHT, SatStates
+from src.app.helpers import Helpers
+from src.app.models.melvin import MelvinSnapshot
+from src.app.models.obj_manager import obj_manager
+from src.app.sim_clock import sim_clock
+from src.app.sim_engine import sim_engine
+
+logger = logging.getLogger(__name__)
+
+# Number of recent pings kept for clients resuming with Last-Event-ID
+ANNOUNCEMENT_HISTORY: int = 512
+# Undelivered pings per client before the oldest are dropped
+ANNOUNCEMENT_QUEUE_SIZE: int = 64
+
+
+class BeaconAnnouncer:
+    """
+    Single producer of the beacon pings sent on /announcements.
+
+    Driven by the simulation timeline: for every sim-time minute boundary a
+    snapshot crosses while Melvin is in COMMS, the noisy distance to every
+    active beacon in range is computed once and broadcast to all subscribers.
+    One snapshot can cross several boundaries at high simulation speeds; each
+    of them is pinged, with Melvin's position at the boundary extrapolated
+    back from the snapshot along its velocity. Pings get event IDs and the
+    recent ones are kept for resuming clients.
+
+    The beacons in range are looked up in the objective manager's beacon
+    grid; activity masking and measurement noise then run as one vectorized
+    pass over their beacon columns. The noise comes from a NumPy generator
+    that can be seeded for reproducible runs.
+    """
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        self.rng: np.random.Generator = np.random.default_rng(seed)
+        self.broadcaster = Broadcaster(history=ANNOUNCEMENT_HISTORY, queue_size=ANNOUNCEMENT_QUEUE_SIZE,
+                                       policy=OverflowPolicy.DROP_OLDEST)
+        self._last_time: datetime = sim_clock.get_time()
+
+    def on_snapshot(self, snapshot: MelvinSnapshot) -> None:
+        """
+        Broadcast the pings of every minute boundary since the previous snapshot.
+
+        Args:
+            snapshot (MelvinSnapshot): The snapshot just published.
+        """
+        minute = self._last_time.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        self._last_time = max(self._last_time, snapshot.timestamp)
+        if snapshot.state != SatStates.COMMS:
+            return
+
+        while minute <= snapshot.timestamp:
+            for message in self.compute_pings(self.position_at(snapshot, minute), minute):
+                self.broadcaster.publish(message)
+            minute += timedelta(minutes=1)
+
+    @staticmethod
+    def position_at(snapshot: MelvinSnapshot, time: datetime) -> Tuple[float, float]:
+        """
+        Returns:
+            Tuple[float, float]: Melvin's position at an earlier time, assuming the
+                velocity of the snapshot (exact unless a burn happened in between).
+        """
+        dt = (snapshot.timestamp - time).total_seconds()
+        return (Helpers.wrap_coordinate(snapshot.pos[0] - snapshot.vel[0] * dt, MAP_WIDTH),
+                Helpers.wrap_coordinate(snapshot.pos[1] - snapshot.vel[1] * dt, MAP_HEIGHT))
+
+    def seed(self, seed: Optional[int]) -> None:
+        """
+        Restart the noise generator from a seed, or from fresh entropy if None.
+        """
+        self.rng = np.random.default_rng(seed)
+
+    def compute_pings(self, pos: Tuple[float, float], now: datetime) -> List[str]:
+        """
+        Args:
+            pos (Tuple[float, float]): Melvin's position.
+            now (datetime): Simulation time of the pings.
+
+        Returns:
+            List[str]: One ping payload per active beacon within detection range, by ascending ID.
+        """
+        in_range = obj_manager.get_beacons_in_radius(pos, BEACON_MAX_DETECT_RANGE)
+        ids, distances = obj_manager.beacon_columns.ping([beacon.id for beacon in in_range], pos, now, self.rng)
+        messages = [f"ID_{beacon_id} DISTANCE_{distance:.2f}" for beacon_id, distance in zip(ids, distances)]
+        logger.debug(f"Sending {len(messages)} SSE pings.")
+        return messages
+
+
+def seed_from_env() -> Optional[int]:
+    """
+    Returns:
+        Optional[int]: The PALANTIRI_SEED environment variable as an integer, None if unset.
+    """
+    seed = os.environ.get("PALANTIRI_SEED")
+    return int(seed) if seed else None
+
+
+# Singleton instance
+beacon_announcer = BeaconAnnouncer(seed_from_env())
+sim_engine.add_listener(beacon_announcer.on_snapshot)
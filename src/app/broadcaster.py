@@ -0,0 +1,160 @@
+import threading
+from collections import deque
+from enum import Enum
+from typing import Deque, List, Optional, Tuple
+
+# Default number of undelivered messages a subscriber may hold
+SUBSCRIBER_QUEUE_SIZE: int = 256
+
+# Seconds without a message after which an SSE stream sends a comment, so dead clients are noticed
+STREAM_KEEPALIVE: float = 15.0
+
+
+class OverflowPolicy(Enum):
+    """
+    What happens when a subscriber's queue is full.
+    """
+    DROP_OLDEST = "drop_oldest"  # discard the oldest undelivered message
+    DISCONNECT = "disconnect"  # close the subscription
+
+
+class Subscription:
+    """
+    Bounded queue of messages for one subscriber of a Broadcaster.
+
+    Publishing never blocks: a full queue is handled according to the
+    overflow policy, so a slow reader cannot hold up the producer.
+    """
+
+    def __init__(self, max_size: int = SUBSCRIBER_QUEUE_SIZE,
+                 policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST) -> None:
+        self.max_size: int = max_size
+        self.policy: OverflowPolicy = policy
+        self.dropped: int = 0
+        self.closed: bool = False
+        self._queue: Deque[str] = deque()
+        self._cond = threading.Condition()
+
+    def put(self, message: str) -> None:
+        with self._cond:
+            if self.closed:
+                return
+            if len(self._queue) >= self.max_size:
+                if self.policy is OverflowPolicy.DISCONNECT:
+                    self.closed = True
+                    self._queue.clear()
+                    self._cond.notify_all()
+                    return
+                self._queue.popleft()
+                self.dropped += 1
+            self._queue.append(message)
+            self._cond.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Wait for the next message.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait, forever if None.
+
+        Returns:
+            Optional[str]: The next message, or None if the timeout expired or
+                the subscription was closed (check `closed`).
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._queue or self.closed, timeout=timeout)
+            if self._queue:
+                return self._queue.popleft()
+            return None
+
+
+class Broadcaster:
+    """
+    Fans out messages from one producer to any number of subscribers.
+
+    Messages are formatted once by the producer and the same object is handed
+    to every subscriber, so the cost per subscriber is a queue put. With a
+    history size, messages carry increasing SSE event IDs and the most recent
+    ones are kept in a ring buffer, so reconnecting clients can resume from
+    their Last-Event-ID.
+    """
+
+    def __init__(self, history: int = 0, queue_size: int = SUBSCRIBER_QUEUE_SIZE,
+                 policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST) -> None:
+        self.queue_size: int = queue_size
+        self.policy: OverflowPolicy = policy
+        self.last_id: int = 0
+        self._history: Deque[Tuple[int, str]] = deque(maxlen=history)
+        self._subscribers: List[Subscription] = []
+        self._lock = threading.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> Subscription:
+        """
+        Add a subscriber.
+
+        Args:
+            last_event_id (Optional[int]): Replay the buffered messages after this ID first.
+
+        Returns:
+            Subscription: Queue receiving all messages published from now on.
+        """
+        subscription = Subscription(self.queue_size, self.policy)
+        with self._lock:
+            if last_event_id is not None:
+                for event_id, message in self._history:
+                    if event_id > last_event_id:
+                        subscription.put(message)
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def publish(self, data: str, event: Optional[str] = None) -> None:
+        """
+        Format a message once and queue it for every subscriber.
+
+        Args:
+            data (str): Single-line payload.
+            event (Optional[str]): SSE event name, the default "message" event if None.
+        """
+        with self._lock:
+            event_id: Optional[int] = None
+            if self._history.maxlen:
+                self.last_id += 1
+                event_id = self.last_id
+            message = format_sse(data, event, event_id)
+            if event_id is not None:
+                self._history.append((event_id, message))
+
+            for subscription in self._subscribers:
+                subscription.put(message)
+            # Subscriptions closed by the disconnect policy are dropped here
+            self._subscribers = [s for s in self._subscribers if not s.closed]
+
+
+def format_sse(data: str, event: Optional[str] = None, event_id: Optional[int] = None) -> str:
+    """
+    Format a Server-Sent Events message.
+
+    Args:
+        data (str): Single-line payload.
+        event (Optional[str]): Event name, the default "message" event if None.
+        event_id (Optional[int]): Event ID reported back by clients as Last-Event-ID.
+
+    Returns:
+        str: The encoded event, terminated by a blank line.
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}\n")
+    if event is not None:
+        lines.append(f"event: {event}\n")
+    lines.append(f"data: {data}\n\n")
+    return "".join(lines)
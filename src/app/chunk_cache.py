@@ -0,0 +1,94 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Tuple
+
+from src.app.constants import CameraAngle, IMAGE_CACHE_MAX_BYTES
+from src.app.image_loader import ChunkEncoding
+
+ChunkKey = Tuple[int, int, CameraAngle, int, ChunkEncoding]
+
+
+class ChunkCache:
+    """
+    Bounded LRU cache of encoded map chunks, evicting by total byte size.
+
+    Keys carry the map version they were encoded from. Whenever a request
+    arrives with a newer map version, all entries are dropped at once.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes: int = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._entries: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._size: int = 0
+        self._version: int = 0
+        self._lock = threading.Lock()
+
+    def get_or_encode(self, key: ChunkKey, encode: Callable[[], bytes]) -> bytes:
+        """
+        Return the cached bytes for a key, encoding and storing them on a miss.
+
+        Args:
+            key (ChunkKey): (x, y, camera angle, map version, encoding) of the chunk.
+            encode (Callable[[], bytes]): Produces the encoded chunk on a miss.
+
+        Returns:
+            bytes: The encoded chunk.
+        """
+        version = key[3]
+        with self._lock:
+            if version != self._version:
+                self._clear()
+                self._version = version
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        data = encode()
+
+        with self._lock:
+            if version != self._version or len(data) > self.max_bytes or key in self._entries:
+                return data
+            self._entries[key] = data
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+        return data
+
+    def clear(self) -> None:
+        """
+        Drop all cached chunks.
+        """
+        with self._lock:
+            self._clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: Hit/miss/eviction counters and current occupancy.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "map_version": self._version,
+            }
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+
+# Singleton instance
+chunk_cache = ChunkCache(IMAGE_CACHE_MAX_BYTES)
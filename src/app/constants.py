@@ -33,6 +33,9 @@ START_FUEL: float = 100.0
 # Sim step duration (seconds)
 SIM_STEP_DUR: float = 0.5
 
+# Upper bound of the simulation speed factor (sim seconds per wall-clock second)
+MAX_SIMULATION_SPEED: int = 1000
+
 # Transition times between satellite states (seconds)
 TRANSITION_TIME_STANDARD: int = (3 * 60) - 1
 TRANSITION_TIME_FROM_SAFE: int = 20 * 60
@@ -42,6 +45,19 @@ TRANSITION_TIME_TO_SAFE: int = 1 * 60
 BEACON_MAX_DETECT_RANGE: int = 2000
 BEACON_GUESS_TOLERANCE: float = 75.0
 
+# Edge length (pixels) of the cells of the coverage bitmaps, 1 = per pixel
+COVERAGE_CELL_SIZE: int = 1
+
+# Byte budget of the encoded /image chunk cache
+IMAGE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
+# Daily map scoring: tile edge length and rows compared per strip (pixels)
+DAILY_MAP_TILE_SIZE: int = 1200
+DAILY_MAP_STRIP_ROWS: int = 240
+
+# Edge length (pixels) of the cells of the spatial index over zones and beacons
+SPATIAL_GRID_CELL_SIZE: int = 600
+
 
 class SatStates(Enum):
     """
@@ -141,3 +157,42 @@ class CameraAngle(Enum):
             return 1000
 
         return 0
+
+
+class ImageFormat(Enum):
+    """
+    Enum representing the encodings offered by the /image endpoint.
+    """
+    PNG = "png"
+    WEBP = "webp"
+    JPEG = "jpeg"
+    RAW = "raw"
+
+    @staticmethod
+    def is_valid_image_format(input_format: str) -> bool:
+        """
+        Check if a string corresponds to a valid image format.
+
+        Args:
+            input_format (str): The format to validate.
+
+        Returns:
+            bool: True if valid, False otherwise.
+        """
+        return input_format in {image_format.value for image_format in ImageFormat}
+
+    def get_mimetype(self) -> str:
+        """
+        Get the MIME type used to serve and negotiate the format.
+
+        Returns:
+            str: MIME type of the encoded image.
+        """
+        if self == ImageFormat.WEBP:
+            return "image/webp"
+        elif self == ImageFormat.JPEG:
+            return "image/jpeg"
+        elif self == ImageFormat.RAW:
+            return "application/octet-stream"
+
+        return "image/png"
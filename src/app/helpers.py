@@ -1,9 +1,9 @@
 import math
-import random
 import logging
 from datetime import timedelta
 
 import numpy as np
+import numpy.typing as npt
 from typing import List, Union, Tuple
 
 from numpy import floating
@@ -13,6 +13,9 @@ from src.app.constants import SatStates, TRANSITION_TIME_STANDARD, TRANSITION_TI
 
 logger = logging.getLogger(__name__)
 
+# Map size along the (x, y) axis of position arrays
+MAP_SIZE = np.array([MAP_WIDTH, MAP_HEIGHT], dtype=np.float64)
+
 
 class Helpers:
 
@@ -66,6 +69,45 @@ class Helpers:
         """
         return ((value % max_value) + max_value) % max_value
 
+    @staticmethod
+    def get_zone_size(zone: List[int]) -> Tuple[int, int]:
+        """
+        Compute width and height of a zone that may wrap around the map seams.
+
+        Args:
+            zone (List[int]): [x1, y1, x2, y2] coordinates, x2 < x1 or y2 < y1 when wrapping.
+
+        Returns:
+            Tuple[int, int]: Width and height of the zone.
+        """
+        width = zone[2] - zone[0] if zone[2] >= zone[0] else zone[2] + MAP_WIDTH - zone[0]
+        height = zone[3] - zone[1] if zone[3] >= zone[1] else zone[3] + MAP_HEIGHT - zone[1]
+        return width, height
+
+    @staticmethod
+    def ring_overlaps(start_a: int, len_a: int, start_b: int, len_b: int, size: int) -> List[Tuple[int, int]]:
+        """
+        Intersect two intervals on a ring, e.g. zone extents along a wrapping map axis.
+
+        Args:
+            start_a (int): Start of interval a.
+            len_a (int): Length of interval a (at most size).
+            start_b (int): Start of interval b.
+            len_b (int): Length of interval b (at most size).
+            size (int): Circumference of the ring.
+
+        Returns:
+            List[Tuple[int, int]]: (offset relative to start_a, length) of each overlapping piece.
+        """
+        offset_b = (start_b - start_a) % size
+        pieces = []
+        for shifted in (offset_b, offset_b - size):
+            lo = max(0, shifted)
+            hi = min(len_a, shifted + len_b)
+            if lo < hi:
+                pieces.append((lo, hi - lo))
+        return pieces
+
     @staticmethod
     def format_sim_duration(duration: timedelta) -> str:
         """
@@ -83,26 +125,21 @@ class Helpers:
         return f"{hours:02}:{minutes:02}:{seconds:02}"
 
     @staticmethod
-    def receive_noisy_measurement(beac_pos: List[float], melvin_pos: List[float]) -> float:
+    def receive_noisy_measurements(true_distances: npt.NDArray[np.float64],
+                                   rng: np.random.Generator) -> npt.NDArray[np.float64]:
         """
-        Simulate receiving a noisy measurement of distance.
+        Simulate receiving noisy measurements of already computed true distances.
 
         Args:
-            beac_pos (List[float]): Beacon position.
-            melvin_pos (List[float]): Satellite position.
+            true_distances (np.ndarray): Distances between beacons and the satellite.
+            rng (np.random.Generator): Source of the noise gains.
 
         Returns:
-            float: Noisy measured distance.
+            np.ndarray: Noisy measured distances.
         """
-        noise_gain: float = random.uniform(-1, 1)
-
-        true_distance: float = Helpers.unwrapped_to(beac_pos, melvin_pos)
-
-        noise: float = 3.0 * BEACON_GUESS_TOLERANCE + 0.1 * (true_distance + 1)
-
-        noisy_distance: float = true_distance + noise_gain * noise
-
-        return noisy_distance
+        noise_gain = rng.uniform(-1, 1, size=true_distances.shape)
+        noise = 3.0 * BEACON_GUESS_TOLERANCE + 0.1 * (true_distances + 1)
+        return true_distances + noise_gain * noise
 
     @staticmethod
     def unwrapped_to(object_1: List[float], object2: List[float]) -> float:
@@ -116,56 +153,57 @@ class Helpers:
         Returns:
             float: Shortest unwrapped distance.
         """
-        # Generate all wrapped projections from object1 to object2
-        options = Helpers.get_projected_in_range(object_1, object2, [1, 0, -1], [1, 0, -1])
-
-        # Select the one with the smallest squared distance
-        best_vector, _ = min(options, key=lambda item: item[1])
-        best_vector_sq = math.sqrt(best_vector[0] * best_vector[0] + best_vector[1] * best_vector[1])
-
-        return best_vector_sq
+        return float(Helpers.wrapped_distances(object_1, object2))
 
     @staticmethod
-    def to(object1: List[float], object2: List[float]) -> List[float]:
+    def wrapped_displacements(origins: npt.ArrayLike, targets: npt.ArrayLike) -> npt.NDArray[np.float64]:
         """
-        Compute vector from one point to another.
+        Compute the shortest displacements on the toroidal map.
+
+        Positions are arrays whose last axis is (x, y); all other axes
+        broadcast. Pass one point and an (N, 2) array for one-to-many, or
+        an (N, 1, 2) and a (1, M, 2) array for an (N, M) grid.
 
         Args:
-            object1 (List[float]): Start position.
-            object2 (List[float]): End position.
+            origins (npt.ArrayLike): From positions.
+            targets (npt.ArrayLike): To positions.
 
         Returns:
-            List[float]: Vector from object1 to object2.
+            np.ndarray: Shortest (dx, dy) from each origin to each target.
         """
-        return [object2[0] - object1[0], object2[1] - object1[1]]
+        delta: npt.NDArray[np.float64] = np.subtract(targets, origins, dtype=np.float64)
+        delta -= MAP_SIZE * np.round(delta / MAP_SIZE)
+        return delta
 
     @staticmethod
-    def get_projected_in_range(object_1: List[float], object_2: List[float], x_range: List[int], y_range: List[int]) -> \
-            List[Tuple[List[float], float]]:
+    def wrapped_distances(origins: npt.ArrayLike, targets: npt.ArrayLike) -> npt.NDArray[np.float64]:
         """
-                Get all coordinate projections with wrap-around logic.
-
-                Args:
-                    object_1 (List[float]): Start position.
-                    object_2 (List[float]): End position.
-                    x_range (List[int]): X direction offsets.
-                    y_range (List[int]): Y direction offsets.
+        Compute the shortest distances on the toroidal map. Broadcasts like `wrapped_displacements`.
 
-                Returns:
-                    List[Tuple[List[float], float]]: Tuples of vector and distance.
-                """
-        options = []
+        Args:
+            origins (npt.ArrayLike): From positions.
+            targets (npt.ArrayLike): To positions.
 
-        for x_sign in x_range:
-            for y_sign in y_range:
-                target = [object_2[0] + MAP_WIDTH * x_sign, object_2[1] + MAP_HEIGHT * y_sign]
+        Returns:
+            np.ndarray: Distances, with the last axis of the inputs removed.
+        """
+        delta = Helpers.wrapped_displacements(origins, targets)
+        distances: npt.NDArray[np.float64] = np.hypot(delta[..., 0], delta[..., 1])
+        return distances
 
-                to_target = Helpers.to(object_1, target)
-                to_target_abs_sq = math.hypot(to_target[0], to_target[1])
+    @staticmethod
+    def to(object1: List[float], object2: List[float]) -> List[float]:
+        """
+        Compute vector from one point to another.
 
-                options.append((to_target, to_target_abs_sq))
+        Args:
+            object1 (List[float]): Start position.
+            object2 (List[float]): End position.
 
-        return options
+        Returns:
+            List[float]: Vector from object1 to object2.
+        """
+        return [object2[0] - object1[0], object2[1] - object1[1]]
 
     @staticmethod
     def is_pos_in_bounds(position: List[int]) -> bool:
@@ -214,53 +252,98 @@ class Helpers:
         return math.degrees(angle_rad)
 
     @staticmethod
-    def compute_acceleration_limits(dvx: float, dvy: float) -> Tuple[float, float]:
+    def validate_velocity_change(old_v: List[float], target_v: List[float]) -> "VelocityPlan":
         """
-        Compute given acceleration limits based on desired delta-V.
+        Generate a velocity change plan from current to target velocity.
 
         Args:
-            dvx (float): Delta velocity in x.
-            dvy (float): Delta velocity in y.
+            old_v (List[float]): Current velocity.
+            target_v (List[float]): Desired velocity.
 
         Returns:
-            Tuple[float, float]: Acceleration limits in x and y.
+            VelocityPlan: Lazily evaluated sequence of velocity steps.
         """
-        ax = math.sqrt(pow(ACC_CONST, 2) / (1 + (dvy / dvx) ** 2)) if dvx != 0 else 0
-        ay = math.sqrt(pow(ACC_CONST, 2) / (1 + (dvx / dvy) ** 2)) if dvy != 0 else 0
-        return ax, ay
+        return VelocityPlan(old_v, target_v)
 
-    @staticmethod
-    def validate_velocity_change(old_v: List[float], target_v: List[float]) -> List[Tuple[float, float]]:
+
+class VelocityPlan:
+    """
+    Straight-line velocity change from a start to a target velocity.
+
+    The velocity changes by ACC_CONST per sim step along the direction of the
+    delta-V and lands exactly on the target in the last step. Every step is
+    computed in closed form, so creating, replacing or cancelling a plan is
+    O(1) regardless of the delta-V. The truthiness and `len()` of a plan
+    reflect its remaining steps.
+    """
+
+    def __init__(self, start_v: List[float], target_v: List[float]) -> None:
+        self.start: Tuple[float, float] = (start_v[0], start_v[1])
+        self.target: Tuple[float, float] = (target_v[0], target_v[1])
+
+        dvx = self.target[0] - self.start[0]
+        dvy = self.target[1] - self.start[1]
+        delta_v = math.hypot(dvx, dvy)
+
+        if abs(dvx) < 1e-3 and abs(dvy) < 1e-3:
+            self.total_steps: int = 0
+            self.acc: Tuple[float, float] = (0.0, 0.0)
+        else:
+            self.total_steps = max(1, math.ceil(delta_v / ACC_CONST - 1e-9))
+            self.acc = (ACC_CONST * dvx / delta_v, ACC_CONST * dvy / delta_v)
+        self.steps_done: int = 0
+
+    def __len__(self) -> int:
+        return self.total_steps - self.steps_done
+
+    def velocity_at(self, step: int) -> Tuple[float, float]:
         """
-        Generate a velocity change plan from current to target velocity.
+        Velocity after a given number of plan steps.
 
         Args:
-            old_v (List[float]): Current velocity.
-            target_v (List[float]): Desired velocity.
+            step (int): Number of applied steps.
+
+        Returns:
+            Tuple[float, float]: Velocity (vx, vy).
+        """
+        if step >= self.total_steps:
+            return self.target
+        return self.start[0] + step * self.acc[0], self.start[1] + step * self.acc[1]
+
+    def next(self) -> Tuple[float, float]:
+        """
+        Apply the next step of the plan.
 
         Returns:
-            List[Tuple[float, float]]: Sequence of velocity steps.
+            Tuple[float, float]: The new velocity (vx, vy).
         """
-        plan: List[Tuple[float, float]] = []
-        current_v: List[float] = old_v.copy()
+        self.steps_done = min(self.steps_done + 1, self.total_steps)
+        return self.velocity_at(self.steps_done)
 
-        while True:
-            dvx = target_v[0] - current_v[0]
-            dvy = target_v[1] - current_v[1]
+    def skip(self, steps: int) -> Tuple[float, float]:
+        """
+        Apply several steps of the plan at once.
 
-            if abs(dvx) < 1e-3 and abs(dvy) < 1e-3:
-                break  # Target reached
+        Args:
+            steps (int): Number of steps to apply.
 
-            ax_abs, ay_abs = Helpers.compute_acceleration_limits(abs(dvx), abs(dvy))
-            ax = math.copysign(ax_abs, dvx)
-            ay = math.copysign(ay_abs, dvy)
-            ax = min(ax, dvx)
-            ay = min(ay, dvy)
+        Returns:
+            Tuple[float, float]: The new velocity (vx, vy).
+        """
+        self.steps_done = min(self.steps_done + steps, self.total_steps)
+        return self.velocity_at(self.steps_done)
 
-            step_vx = current_v[0] + ax
-            step_vy = current_v[1] + ay
+    def velocity_sum(self, steps: int) -> Tuple[float, float]:
+        """
+        Sum of the velocities at the start of each of the next steps, used to integrate position.
 
-            current_v = [step_vx, step_vy]
-            plan.append((step_vx, step_vy))
+        Args:
+            steps (int): Number of upcoming steps, at most `len(self)`.
 
-        return plan
+        Returns:
+            Tuple[float, float]: Sum of (vx, vy) over the steps.
+        """
+        # sum_{i=0}^{steps-1} (start + (steps_done + i) * acc)
+        factor = steps * self.steps_done + steps * (steps - 1) / 2
+        return (steps * self.start[0] + factor * self.acc[0],
+                steps * self.start[1] + factor * self.acc[1])
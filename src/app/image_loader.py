@@ -1,15 +1,23 @@
+import hashlib
 import logging
+import os
+import struct
+from dataclasses import dataclass
 from io import BytesIO
 import tempfile
-from typing import Tuple, Optional, Any
+from functools import lru_cache
+from typing import Tuple, Optional, Any, List
 
 import cairo
+import numpy as np
 from PIL import Image
 from PIL.Image import Image as PILImage
 
 Image.MAX_IMAGE_PIXELS = 933120000
 
-from src.app.constants import MAP_HEIGHT, MAP_WIDTH
+from src.app.constants import MAP_HEIGHT, MAP_WIDTH, ImageFormat
+from src.app.helpers import Helpers
+from src.app.map_store import MapStore, RGBArray
 
 from ctypes import CDLL, POINTER, Structure, byref, util
 from ctypes import c_bool, c_byte, c_void_p, c_int, c_double, c_uint32, c_char_p
@@ -106,20 +114,93 @@ class Handle(object):
         # return _librsvg.rsvg_handle_render_cairo(self.handle, z.ctx)
 
 
-PADDING = 600
+MAP_SVG_PATH: str = "assets/test_image.svg"
+MAP_CACHE_DIR: str = os.environ.get("PALANTIRI_MAP_CACHE_DIR", ".cache")
+_CACHE_WRITE_ROWS: int = 1024
+_CACHE_FORMAT: str = "rgb8-v2"
+
+logger = logging.getLogger(__name__)
 
 
 # --- Map generation and overlay handling ---
-def load_map_image() -> PILImage:
+def _map_cache_key(svg_path: str) -> str:
+    """
+    Compute the content address of a rendered map raster.
+
+    Args:
+        svg_path (str): Path to the source SVG.
+
+    Returns:
+        str: Hex digest over the SVG bytes, the raster geometry and format.
+    """
+    digest = hashlib.sha256()
+    with open(svg_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    digest.update(f"{MAP_WIDTH}x{MAP_HEIGHT}:{_CACHE_FORMAT}".encode())
+    return digest.hexdigest()
+
+
+def _store_raster(image: PILImage, cache_path: str) -> None:
+    """
+    Write the raw RGB bytes of an image to the cache, row strip by row strip.
+
+    The file is written next to its final location and renamed into place, so
+    concurrently starting workers never see a partially written raster.
+
+    Args:
+        image (Image.Image): The rendered RGB map.
+        cache_path (str): Destination of the raw raster.
+    """
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for top in range(0, image.height, _CACHE_WRITE_ROWS):
+                bottom = min(top + _CACHE_WRITE_ROWS, image.height)
+                f.write(image.crop((0, top, image.width, bottom)).tobytes())
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_map_raster() -> RGBArray:
+    """
+    Load the base map raster, rendering it only if no cached raster exists.
+
+    The cache is keyed by the SVG content and the map geometry, so changing
+    either of them transparently triggers a new render. The cached raster is
+    memory-mapped read-only, which lets worker processes share its pages.
+
+    Returns:
+        np.ndarray: (MAP_HEIGHT, MAP_WIDTH, 3) uint8 raster of the map.
+    """
+    cache_path = os.path.join(MAP_CACHE_DIR, f"map_{_map_cache_key(MAP_SVG_PATH)}.rgb")
+
+    if not (os.path.isfile(cache_path) and os.path.getsize(cache_path) == MAP_WIDTH * MAP_HEIGHT * 3):
+        image = render_map_image()
+        try:
+            _store_raster(image, cache_path)
+            logger.info(f"Stored map raster in {cache_path}")
+        except OSError as e:
+            logger.warning(f"Could not cache map raster: {e}")
+            return np.asarray(image, dtype=np.uint8)
+
+    logger.info(f"Loading cached map raster from {cache_path}")
+    return np.memmap(cache_path, dtype=np.uint8, mode="r", shape=(MAP_HEIGHT, MAP_WIDTH, 3))
+
+
+def render_map_image() -> PILImage:
     """
-    Load and render the base map from SVG, then pad and tile it for wraparound.
+    Render the base map from SVG.
 
     Returns:
-        Image.Image: A padded and wrapped version of the rendered map.
+        Image.Image: The rendered map without any padding.
     """
     img = cairo.ImageSurface(cairo.FORMAT_ARGB32, MAP_WIDTH, MAP_HEIGHT)
     ctx = cairo.Context(img)
-    handle = Handle("assets/test_image.svg")
+    handle = Handle(MAP_SVG_PATH)
     handle.render_cairo(ctx)
 
     # CHRIS artifact
@@ -130,36 +211,10 @@ def load_map_image() -> PILImage:
         img.write_to_png(f.name)
         base_image = Image.open(f.name).convert("RGB")
 
-    image = Image.new("RGB", (MAP_WIDTH + (2 * PADDING), MAP_HEIGHT + (2 * PADDING)))
-
-    # center
-    image.paste(base_image, (PADDING, PADDING))
-
-    # left
-    image.paste(
-        base_image.crop((MAP_WIDTH - PADDING, 0, MAP_WIDTH, MAP_HEIGHT - 1)),
-        (0, PADDING),
-    )
-    # right
-    image.paste(
-        base_image.crop((0, 0, PADDING, MAP_HEIGHT)), (MAP_WIDTH + PADDING, PADDING)
-    )
-    # top
-    image.paste(
-        image.crop((0, MAP_HEIGHT, MAP_WIDTH + (2 * PADDING), MAP_HEIGHT + PADDING)),
-        (0, 0),
-    )
-    # bottom
-    image.paste(
-        image.crop((0, 0, MAP_WIDTH + (2 * PADDING), PADDING)),
-        (0, MAP_HEIGHT + PADDING),
-    )
-
-    return image
-
-
-def_map_image = load_map_image()
-current_map_image = def_map_image.copy()
+    return base_image
+
+
+map_store = MapStore(load_map_raster())
 obj_image = Image.open("assets/obj_img.png").convert("RGBA")
 
 
@@ -171,77 +226,140 @@ def get_obj_img() -> PILImage:
     return obj_image
 
 
-def get_map_chunk(center_pos: tuple[int, int], size: int) -> bytes:
+# Header of raw chunks: magic, width, height, channels (little endian)
+RAW_CHUNK_HEADER = struct.Struct("<4sHHB")
+RAW_CHUNK_MAGIC: bytes = b"PRGB"
+
+
+@dataclass(frozen=True)
+class ChunkEncoding:
+    """
+    Encoding requested for a map chunk. Unset knobs fall back to Pillow's defaults.
+    """
+    image_format: ImageFormat = ImageFormat.PNG
+    quality: Optional[int] = None
+    compress_level: Optional[int] = None
+
+
+def encode_chunk(chunk: RGBArray, encoding: ChunkEncoding) -> bytes:
+    """
+    Encode an RGB chunk in the requested format.
+
+    Raw chunks are the pixel bytes in row-major RGB order behind a
+    RAW_CHUNK_HEADER, so they cost no encoding at all.
+
+    Args:
+        chunk (np.ndarray): (height, width, 3) uint8 pixels.
+        encoding (ChunkEncoding): Target format and compression knobs.
+
+    Returns:
+        bytes: The encoded image.
+    """
+    height, width = chunk.shape[:2]
+    if encoding.image_format == ImageFormat.RAW:
+        return RAW_CHUNK_HEADER.pack(RAW_CHUNK_MAGIC, width, height, 3) + chunk.tobytes()
+
+    params: dict[str, int] = {}
+    if encoding.image_format == ImageFormat.PNG and encoding.compress_level is not None:
+        params["compress_level"] = encoding.compress_level
+    if encoding.image_format in (ImageFormat.JPEG, ImageFormat.WEBP) and encoding.quality is not None:
+        params["quality"] = encoding.quality
+
+    image_bytes = BytesIO()
+    Image.fromarray(chunk, "RGB").save(image_bytes, format=encoding.image_format.name, **params)
+    return image_bytes.getvalue()
+
+
+def get_map_chunk(center_pos: tuple[int, int], size: int, encoding: ChunkEncoding = ChunkEncoding()) -> bytes:
     """
     Crop a square region of the map around a given position.
 
     Args:
         center_pos (Tuple[int, int]): (x, y) center of the crop.
         size (int): Side length of the square.
+        encoding (ChunkEncoding): Output encoding, PNG by default.
 
     Returns:
-        bytes: PNG bytes of the cropped image.
+        bytes: Encoded bytes of the cropped image.
     """
-    assert (size / 2) < PADDING
-
     center_left, center_top = center_pos
 
-    offset_left = center_left - size / 2
-    offset_top = center_top - size / 2
-    image_bytes = BytesIO()
-    current_map_image.crop(
-        (
-            offset_left + PADDING,
-            offset_top + PADDING,
-            offset_left + PADDING + size,
-            offset_top + PADDING + size,
-        )
-    ).save(image_bytes, format="PNG")
-    return image_bytes.getvalue()
+    chunk = map_store.crop(center_left - size // 2, center_top - size // 2, size, size)
+    return encode_chunk(chunk, encoding)
 
 
 def get_full_map() -> PILImage:
     """
     Returns:
-        Image.Image: The full, wrapped current map image.
+        Image.Image: The full current map image (MAP_WIDTH x MAP_HEIGHT).
     """
-    return current_map_image
+    return Image.fromarray(map_store.crop(0, 0, MAP_WIDTH, MAP_HEIGHT), "RGB")
 
 
-def apply_map_overlay(overlay: PILImage) -> None:
+@lru_cache(maxsize=64)
+def get_obj_sprite(width: int, height: int) -> PILImage:
     """
-    Blend an RGBA overlay onto the current map image using its alpha channel.
+    Return the objective marker scaled to a zone size.
+
+    Zone sizes repeat a lot (they derive from the camera side lengths), so the
+    resized sprites are cached instead of resampled for every objective.
 
     Args:
-        overlay (Image.Image): The overlay image to apply.
+        width (int): Zone width in pixels.
+        height (int): Zone height in pixels.
 
-    Raises:
-        ValueError: If dimensions do not match.
+    Returns:
+        Image.Image: The resized RGBA marker. Callers must not modify it.
     """
-    (width, height) = overlay.size
-    if width != (MAP_WIDTH + 2 * PADDING) or height != (MAP_HEIGHT + 2 * PADDING):
-        logging.getLogger(__name__).info(f"width: {width}, height: {height}")
-        raise ValueError("Overlay must be the same size as the map")
-    alpha = overlay.split()[3]
-    current_map_image.paste(overlay, (0, 0), mask=alpha)
+    return get_obj_img().resize((width, height), Image.Resampling.LANCZOS)
 
 
-def remove_map_overlay(overlay: PILImage) -> None:
+def apply_map_overlay(sprite: PILImage, zone: List[int], clip: Optional[List[int]] = None) -> None:
     """
-    Restore the default map underneath the masked region defined by an overlay.
+    Blend an RGBA sprite into a zone of the current map using its alpha channel.
+
+    Only the tiles covered by the zone are touched. Zones wrapping around the
+    map seams are split accordingly.
 
     Args:
-        overlay (Image.Image): An RGBA overlay to remove.
+        sprite (Image.Image): RGBA sprite with the size of the zone.
+        zone (List[int]): [x1, y1, x2, y2] zone the sprite is painted into.
+        clip (Optional[List[int]]): If given, only the part of the sprite inside this zone is painted.
 
     Raises:
-        ValueError: If dimensions do not match.
+        ValueError: If the sprite size does not match the zone.
+    """
+    width, height = Helpers.get_zone_size(zone)
+    if sprite.size != (width, height):
+        raise ValueError("Sprite must be the same size as the zone")
+    rgba = np.asarray(sprite.convert("RGBA"), dtype=np.uint8)
+
+    if clip is None:
+        map_store.blend(zone[0], zone[1], rgba)
+        return
+
+    clip_width, clip_height = Helpers.get_zone_size(clip)
+    for off_y, len_y in Helpers.ring_overlaps(zone[1], height, clip[1], clip_height, MAP_HEIGHT):
+        for off_x, len_x in Helpers.ring_overlaps(zone[0], width, clip[0], clip_width, MAP_WIDTH):
+            map_store.blend(zone[0] + off_x, zone[1] + off_y, rgba[off_y:off_y + len_y, off_x:off_x + len_x])
+
+
+def remove_map_overlay(zone: List[int]) -> None:
     """
-    (width, height) = overlay.size
-    if width != MAP_WIDTH or height != MAP_HEIGHT:
-        raise ValueError("Overlay must be the same size as the map")
-    mask_img = overlay.convert("L")
-    # Extract the masked portion
-    masked_region = Image.composite(def_map_image, Image.new("RGBA", def_map_image.size), mask_img)
+    Restore the default map inside a zone.
 
-    # Paste into destination image
-    current_map_image.paste(masked_region, (0, 0), mask_img)
+    Overlays of other zones overlapping this one have to be re-applied with
+    `clip=zone` afterwards.
+
+    Args:
+        zone (List[int]): [x1, y1, x2, y2] zone to restore.
+    """
+    width, height = Helpers.get_zone_size(zone)
+    map_store.restore(zone[0], zone[1], np.ones((height, width), dtype=np.bool_))
+
+
+def clear_map_overlays() -> None:
+    """
+    Drop all overlay edits and return to the default map.
+    """
+    map_store.reset()
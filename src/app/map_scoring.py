@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+from PIL.Image import Image as PILImage
+
+from src.app.constants import MAP_WIDTH, MAP_HEIGHT, DAILY_MAP_TILE_SIZE, DAILY_MAP_STRIP_ROWS
+from src.app.image_loader import map_store
+
+
+@dataclass
+class MapScore:
+    """
+    Mean absolute error of an uploaded map, globally and per tile (0 = identical, 255 = inverted).
+    """
+    mean_difference: float
+    tile_size: int
+    tile_scores: List[List[float]]
+
+
+def score_daily_map(uploaded: PILImage, tile_size: int = DAILY_MAP_TILE_SIZE,
+                    strip_rows: int = DAILY_MAP_STRIP_ROWS) -> MapScore:
+    """
+    Compare an uploaded map with the current map strip by strip.
+
+    Only one strip of both images is held as arrays at any time, and the
+    absolute differences are accumulated into per-tile sums, so memory stays
+    bounded regardless of the map size.
+
+    Args:
+        uploaded (Image.Image): The uploaded map, MAP_WIDTH x MAP_HEIGHT pixels in any mode.
+        tile_size (int): Edge length of the score tiles.
+        strip_rows (int): Number of rows compared at once.
+
+    Returns:
+        MapScore: Global and per-tile mean absolute error.
+
+    Raises:
+        ValueError: If the upload does not have the map dimensions.
+    """
+    if uploaded.size != (MAP_WIDTH, MAP_HEIGHT):
+        raise ValueError(f"Map must be {MAP_WIDTH}x{MAP_HEIGHT} pixels, got {uploaded.width}x{uploaded.height}.")
+
+    tile_cols = np.arange(0, MAP_WIDTH, tile_size)
+    tile_widths = np.diff(np.append(tile_cols, MAP_WIDTH))
+    tile_sums = np.zeros((len(range(0, MAP_HEIGHT, tile_size)), len(tile_cols)), dtype=np.int64)
+    tile_pixels = np.zeros_like(tile_sums)
+
+    top = 0
+    while top < MAP_HEIGHT:
+        # Strips never straddle a tile row
+        bottom = min(top + strip_rows, (top // tile_size + 1) * tile_size, MAP_HEIGHT)
+        upload_strip = np.asarray(uploaded.crop((0, top, MAP_WIDTH, bottom)).convert("RGB"), dtype=np.uint8)
+        map_strip = map_store.crop(0, top, MAP_WIDTH, bottom - top)
+
+        # |a - b| without widening the strip to a signed type
+        diff = np.maximum(upload_strip, map_strip) - np.minimum(upload_strip, map_strip)
+        column_sums = diff.sum(axis=(0, 2), dtype=np.int64)
+
+        tile_row = top // tile_size
+        tile_sums[tile_row] += np.add.reduceat(column_sums, tile_cols)
+        tile_pixels[tile_row] += tile_widths * (bottom - top) * 3
+        top = bottom
+
+    tile_scores = tile_sums / tile_pixels
+    return MapScore(
+        mean_difference=float(tile_sums.sum() / (MAP_WIDTH * MAP_HEIGHT * 3)),
+        tile_size=tile_size,
+        tile_scores=[[round(float(score), 3) for score in row] for row in tile_scores],
+    )
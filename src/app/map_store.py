@@ -0,0 +1,165 @@
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+# Edge length (pixels) of the copy-on-write tiles holding overlay edits
+TILE_SIZE: int = 512
+
+RGBArray = npt.NDArray[np.uint8]
+
+
+def wrapped_spans(start: int, length: int, size: int) -> List[Tuple[int, int, int]]:
+    """
+    Split a 1D range on a ring of the given size into non-wrapping pieces.
+
+    Args:
+        start (int): First coordinate of the range (may be negative or >= size).
+        length (int): Length of the range, at most size.
+        size (int): Circumference of the ring.
+
+    Returns:
+        List[Tuple[int, int, int]]: (ring_start, range_offset, piece_length) triples.
+    """
+    start %= size
+    first = min(length, size - start)
+    spans = [(start, 0, first)]
+    if first < length:
+        spans.append((0, first, length - first))
+    return spans
+
+
+class MapStore:
+    """
+    Toroidal RGB map backed by a single contiguous (height, width, 3) array.
+
+    The base raster is never written to, so it can be a read-only memory map
+    shared between worker processes. Overlay edits are kept as copy-on-write
+    tiles over the base and dropped again once they match the base.
+    """
+
+    def __init__(self, base: RGBArray, tile_size: int = TILE_SIZE) -> None:
+        self._base: RGBArray = base
+        self._tile_size: int = tile_size
+        self._tiles: Dict[Tuple[int, int], RGBArray] = {}
+        self._lock = threading.Lock()
+        self.version: int = 0
+
+    @property
+    def width(self) -> int:
+        return int(self._base.shape[1])
+
+    @property
+    def height(self) -> int:
+        return int(self._base.shape[0])
+
+    @property
+    def edited_tiles(self) -> int:
+        """
+        Returns:
+            int: Number of tiles currently diverging from the base raster.
+        """
+        return len(self._tiles)
+
+    def crop(self, left: int, top: int, width: int, height: int) -> RGBArray:
+        """
+        Read a rectangle of the current map, wrapping around both seams.
+
+        Args:
+            left (int): Left edge (any integer, taken modulo the map width).
+            top (int): Top edge (any integer, taken modulo the map height).
+            width (int): Width of the rectangle, at most the map width.
+            height (int): Height of the rectangle, at most the map height.
+
+        Returns:
+            np.ndarray: A new (height, width, 3) uint8 array.
+        """
+        out: RGBArray = np.empty((height, width, 3), dtype=np.uint8)
+        with self._lock:
+            for y, oy, h in wrapped_spans(top, height, self.height):
+                for x, ox, w in wrapped_spans(left, width, self.width):
+                    out[oy:oy + h, ox:ox + w] = self._base[y:y + h, x:x + w]
+                    for (ty, tx), tile, ys, xs in self._tiles_in(x, y, w, h, create=False):
+                        out[oy + ys.start - y:oy + ys.stop - y, ox + xs.start - x:ox + xs.stop - x] = \
+                            tile[ys.start - ty:ys.stop - ty, xs.start - tx:xs.stop - tx]
+        return out
+
+    def blend(self, left: int, top: int, rgba: npt.NDArray[np.uint8]) -> None:
+        """
+        Alpha-blend an RGBA patch onto the map, wrapping around both seams.
+
+        Args:
+            left (int): Left edge of the patch on the map.
+            top (int): Top edge of the patch on the map.
+            rgba (np.ndarray): (height, width, 4) uint8 patch.
+        """
+        height, width = rgba.shape[:2]
+        with self._lock:
+            for y, oy, h in wrapped_spans(top, height, self.height):
+                for x, ox, w in wrapped_spans(left, width, self.width):
+                    for (ty, tx), tile, ys, xs in self._tiles_in(x, y, w, h, create=True):
+                        src = rgba[oy + ys.start - y:oy + ys.stop - y, ox + xs.start - x:ox + xs.stop - x]
+                        dst = tile[ys.start - ty:ys.stop - ty, xs.start - tx:xs.stop - tx]
+                        alpha = src[..., 3:4].astype(np.uint32)
+                        dst[...] = ((src[..., :3] * alpha + dst * (255 - alpha) + 127) // 255).astype(np.uint8)
+            self.version += 1
+
+    def restore(self, left: int, top: int, mask: npt.NDArray[np.bool_]) -> None:
+        """
+        Restore base pixels under a mask, wrapping around both seams.
+
+        Tiles that end up identical to the base are released.
+
+        Args:
+            left (int): Left edge of the mask on the map.
+            top (int): Top edge of the mask on the map.
+            mask (np.ndarray): (height, width) boolean array of pixels to restore.
+        """
+        height, width = mask.shape
+        with self._lock:
+            for y, oy, h in wrapped_spans(top, height, self.height):
+                for x, ox, w in wrapped_spans(left, width, self.width):
+                    for (ty, tx), tile, ys, xs in list(self._tiles_in(x, y, w, h, create=False)):
+                        sub_mask = mask[oy + ys.start - y:oy + ys.stop - y, ox + xs.start - x:ox + xs.stop - x]
+                        dst = tile[ys.start - ty:ys.stop - ty, xs.start - tx:xs.stop - tx]
+                        dst[sub_mask] = self._base[ys, xs][sub_mask]
+                        if np.array_equal(tile, self._base[ty:ty + tile.shape[0], tx:tx + tile.shape[1]]):
+                            del self._tiles[(ty, tx)]
+            self.version += 1
+
+    def reset(self) -> None:
+        """
+        Drop all edit tiles, returning to the base raster.
+        """
+        with self._lock:
+            self._tiles.clear()
+            self.version += 1
+
+    def _tiles_in(self, x: int, y: int, w: int, h: int, create: bool) -> \
+            Iterator[Tuple[Tuple[int, int], RGBArray, slice, slice]]:
+        """
+        Iterate over the tiles intersecting a non-wrapping rectangle.
+
+        Args:
+            x (int): Left edge inside the map.
+            y (int): Top edge inside the map.
+            w (int): Width of the rectangle.
+            h (int): Height of the rectangle.
+            create (bool): Copy missing tiles from the base instead of skipping them.
+
+        Yields:
+            Tuple: Tile origin, tile array, and the map-space row/column slices of the overlap.
+        """
+        size = self._tile_size
+        for ty in range((y // size) * size, y + h, size):
+            for tx in range((x // size) * size, x + w, size):
+                tile: Optional[RGBArray] = self._tiles.get((ty, tx))
+                if tile is None:
+                    if not create:
+                        continue
+                    tile = np.array(self._base[ty:ty + size, tx:tx + size])
+                    self._tiles[(ty, tx)] = tile
+                ys = slice(max(y, ty), min(y + h, ty + tile.shape[0]))
+                xs = slice(max(x, tx), min(x + w, tx + tile.shape[1]))
+                yield (ty, tx), tile, ys, xs
@@ -0,0 +1,113 @@
+import threading
+from datetime import datetime
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from src.app.helpers import Helpers
+from src.app.models.obj_beacon import BeaconObjective
+
+
+class BeaconColumns:
+    """
+    Beacon positions and time windows stored as parallel NumPy arrays.
+
+    Lets the per-minute pings for thousands of beacons be computed in one
+    vectorized pass instead of a Python loop over BeaconObjective instances.
+    The candidates in range come from the objective manager's beacon grid.
+    Rows are kept packed: removing a beacon moves the last row into its slot.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.size: int = 0
+        self._ids: npt.NDArray[np.int64] = np.empty(capacity, dtype=np.int64)
+        self._pos: npt.NDArray[np.float64] = np.empty((capacity, 2), dtype=np.float64)
+        self._start: npt.NDArray[np.float64] = np.empty(capacity, dtype=np.float64)
+        self._end: npt.NDArray[np.float64] = np.empty(capacity, dtype=np.float64)
+        self._row_of: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, beacon: BeaconObjective) -> None:
+        """
+        Append a beacon, or overwrite the row of a beacon with the same ID.
+
+        Args:
+            beacon (BeaconObjective): The beacon to store.
+        """
+        with self._lock:
+            row = self._row_of.get(beacon.id)
+            if row is None:
+                if self.size == len(self._ids):
+                    self._grow()
+                row = self.size
+                self.size += 1
+                self._row_of[beacon.id] = row
+            self._ids[row] = beacon.id
+            self._pos[row] = (beacon.width, beacon.height)
+            self._start[row] = beacon.start.timestamp()
+            self._end[row] = beacon.end.timestamp()
+
+    def remove(self, beacon_id: int) -> bool:
+        """
+        Remove a beacon by ID.
+
+        Args:
+            beacon_id (int): ID of the beacon.
+
+        Returns:
+            bool: True if the beacon was stored.
+        """
+        with self._lock:
+            row = self._row_of.pop(beacon_id, None)
+            if row is None:
+                return False
+            last = self.size - 1
+            if row != last:
+                for column in (self._ids, self._pos, self._start, self._end):
+                    column[row] = column[last]
+                self._row_of[int(self._ids[row])] = row
+            self.size = last
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._row_of.clear()
+            self.size = 0
+
+    def ping(self, beacon_ids: Sequence[int], melvin_pos: Tuple[float, float], now: datetime,
+             rng: np.random.Generator) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.float64]]:
+        """
+        Measure the noisy distance to those of the given beacons that are active.
+
+        Args:
+            beacon_ids (Sequence[int]): Candidate beacons, e.g. those within detection range.
+                IDs that are no longer stored are skipped.
+            melvin_pos (Tuple[float, float]): Current satellite position.
+            now (datetime): Current simulation time.
+            rng (np.random.Generator): Source of the measurement noise.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: IDs of the pinged beacons in ascending
+                order and their noisy distances.
+        """
+        timestamp = now.timestamp()
+        with self._lock:
+            rows = np.fromiter((self._row_of[beacon_id] for beacon_id in beacon_ids if beacon_id in self._row_of),
+                               dtype=np.int64)
+            active = (self._start[rows] <= timestamp) & (timestamp <= self._end[rows])
+            ids = self._ids[rows][active]
+            distances = Helpers.wrapped_distances(melvin_pos, self._pos[rows][active])
+
+        order = np.argsort(ids)
+        return ids[order], Helpers.receive_noisy_measurements(distances[order], rng)
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._ids)
+        self._ids = np.resize(self._ids, capacity)
+        self._pos = np.resize(self._pos, (capacity, 2))
+        self._start = np.resize(self._start, capacity)
+        self._end = np.resize(self._end, capacity)
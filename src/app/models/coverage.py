@@ -0,0 +1,192 @@
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.app.constants import CameraAngle, MAP_WIDTH, MAP_HEIGHT, COVERAGE_CELL_SIZE
+from src.app.helpers import Helpers
+from src.app.map_store import wrapped_spans
+
+# Number of set bits for every byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+class PackedBitGrid:
+    """
+    Bitset over a (rows, cols) grid, packed eight columns per byte (little bit order).
+    """
+
+    def __init__(self, rows: int, cols: int) -> None:
+        self.rows: int = rows
+        self.cols: int = cols
+        self.bits = np.zeros((rows, (cols + 7) // 8), dtype=np.uint8)
+        self.count: int = 0
+
+    def fill_rect(self, x0: int, y0: int, x1: int, y1: int) -> int:
+        """
+        Set all bits of a non-wrapping rectangle.
+
+        Args:
+            x0 (int): First column.
+            y0 (int): First row.
+            x1 (int): Column after the last one.
+            y1 (int): Row after the last one.
+
+        Returns:
+            int: Number of bits that were newly set.
+        """
+        if x0 >= x1 or y0 >= y1:
+            return 0
+        b0, b1 = x0 // 8, (x1 - 1) // 8
+        mask = np.full(b1 - b0 + 1, 0xFF, dtype=np.uint8)
+        mask[0] &= (0xFF << (x0 % 8)) & 0xFF
+        mask[-1] &= 0xFF >> (7 - (x1 - 1) % 8)
+
+        region = self.bits[y0:y1, b0:b1 + 1]
+        added = int(_POPCOUNT[mask & ~region].sum(dtype=np.int64))
+        region |= mask
+        self.count += added
+        return added
+
+    def fill_wrapped(self, x: int, y: int, width: int, height: int) -> int:
+        """
+        Set all bits of a rectangle that may wrap around the grid edges.
+
+        Args:
+            x (int): Left column, taken modulo the number of columns.
+            y (int): Top row, taken modulo the number of rows.
+            width (int): Number of columns, at most cols.
+            height (int): Number of rows, at most rows.
+
+        Returns:
+            int: Number of bits that were newly set.
+        """
+        added = 0
+        for row, _, h in wrapped_spans(y, min(height, self.rows), self.rows):
+            for col, _, w in wrapped_spans(x, min(width, self.cols), self.cols):
+                added += self.fill_rect(col, row, col + w, row + h)
+        return added
+
+    def fraction(self) -> float:
+        """
+        Returns:
+            float: Share of set bits in the grid.
+        """
+        return self.count / (self.rows * self.cols)
+
+    def clear(self) -> None:
+        self.bits.fill(0)
+        self.count = 0
+
+
+class CoverageTracker:
+    """
+    Tracks which parts of the map have been imaged, separately for every camera angle.
+
+    The covered fractions are kept up to date on every recorded image, so
+    reading them is O(1).
+    """
+
+    def __init__(self, cell_size: int = COVERAGE_CELL_SIZE) -> None:
+        self.cell_size: int = cell_size
+        rows = -(-MAP_HEIGHT // cell_size)
+        cols = -(-MAP_WIDTH // cell_size)
+        self._grids: Dict[CameraAngle, PackedBitGrid] = {angle: PackedBitGrid(rows, cols) for angle in CameraAngle}
+        self.images_taken: int = 0
+        self._lock = threading.Lock()
+
+    def record_image(self, center: Tuple[int, int], angle: CameraAngle) -> None:
+        """
+        Mark the footprint of an image as covered.
+
+        Every cell touched by the footprint counts as covered.
+
+        Args:
+            center (Tuple[int, int]): (x, y) center of the image on the map.
+            angle (CameraAngle): Camera angle the image was taken with.
+        """
+        size = angle.get_side_length()
+        left = center[0] - size // 2
+        top = center[1] - size // 2
+        col0, row0 = left // self.cell_size, top // self.cell_size
+        col1, row1 = -(-(left + size) // self.cell_size), -(-(top + size) // self.cell_size)
+        with self._lock:
+            self._grids[angle].fill_wrapped(col0, row0, col1 - col0, row1 - row0)
+            self.images_taken += 1
+
+    def get_area_covered(self) -> Dict[str, float]:
+        """
+        Returns:
+            Dict[str, float]: Covered share of the map per camera angle.
+        """
+        return {angle.value: round(grid.fraction(), 4) for angle, grid in self._grids.items()}
+
+    def get_summary(self) -> Tuple[int, Dict[str, float]]:
+        """
+        Returns:
+            Tuple[int, Dict[str, float]]: Number of images taken and the covered
+                share per camera angle, read together so they always match.
+        """
+        with self._lock:
+            return self.images_taken, self.get_area_covered()
+
+    def reset(self) -> None:
+        """
+        Forget all recorded images.
+        """
+        with self._lock:
+            for grid in self._grids.values():
+                grid.clear()
+            self.images_taken = 0
+
+
+class ZoneCoverage:
+    """
+    Union of the imaged area inside one zone, kept as a bitmap in zone-local coordinates.
+
+    The bitmap is only allocated once a footprint actually hits the zone.
+    """
+
+    def __init__(self, zone: List[int], cell_size: int = COVERAGE_CELL_SIZE) -> None:
+        self.zone: List[int] = zone
+        self.cell_size: int = cell_size
+        self.width, self.height = Helpers.get_zone_size(zone)
+        self._grid: Optional[PackedBitGrid] = None
+        self._lock = threading.Lock()
+
+    def record_footprint(self, left: int, top: int, size: int) -> int:
+        """
+        Mark the part of a square footprint inside the zone as covered.
+
+        Args:
+            left (int): Left edge of the footprint on the map.
+            top (int): Top edge of the footprint on the map.
+            size (int): Side length of the footprint.
+
+        Returns:
+            int: Number of newly covered cells.
+        """
+        x_pieces = Helpers.ring_overlaps(self.zone[0], self.width, left, size, MAP_WIDTH)
+        y_pieces = Helpers.ring_overlaps(self.zone[1], self.height, top, size, MAP_HEIGHT)
+        if not x_pieces or not y_pieces:
+            return 0
+
+        cell = self.cell_size
+        added = 0
+        with self._lock:
+            if self._grid is None:
+                self._grid = PackedBitGrid(-(-self.height // cell), -(-self.width // cell))
+            for off_y, len_y in y_pieces:
+                for off_x, len_x in x_pieces:
+                    added += self._grid.fill_rect(off_x // cell, off_y // cell,
+                                                  -(-(off_x + len_x) // cell), -(-(off_y + len_y) // cell))
+        return added
+
+    def fraction(self) -> float:
+        """
+        Returns:
+            float: Covered share of the zone.
+        """
+        if self._grid is None:
+            return 0.0
+        return self._grid.fraction()
@@ -1,14 +1,16 @@
-import time
+import math
 import logging
-import threading
 from collections import OrderedDict
-from datetime import timedelta, datetime, timezone
+from dataclasses import dataclass
+from datetime import timedelta, datetime
 from logging import Logger
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from src.app.constants import *
-from src.app.helpers import Helpers
+from src.app.helpers import Helpers, VelocityPlan
+from src.app.models.coverage import CoverageTracker
 from src.app.models.obj_manager import obj_manager
+from src.app.sim_clock import sim_clock
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -17,7 +19,39 @@ logging.basicConfig(
 )
 
 
+@dataclass(frozen=True)
+class MelvinSnapshot:
+    """
+    Immutable view of Melvin's state, published at the end of every sim step.
+
+    Request threads read the latest snapshot through `Melvin.snapshot`, a
+    single reference swapped atomically by the simulation thread, so all
+    fields of one read belong to the same step.
+    """
+    seq: int
+    sim_steps: int
+    timestamp: datetime
+    sim_duration: timedelta
+    pos: Tuple[float, float]
+    vel: Tuple[float, float]
+    bat: float
+    fuel: float
+    state: SatStates
+    state_target: Optional[SatStates]
+    camera_angle: CameraAngle
+    transition_time: float
+    burning: bool
+    simulation_speed: int
+
+
 class Melvin:
+    """
+    Simulated satellite state.
+
+    Only the simulation thread mutates a Melvin instance (directly or through
+    commands submitted to the simulation engine). Everyone else reads
+    `snapshot`.
+    """
     SIM_DUR_PRINTS: int = 300
 
     def __init__(self) -> None:
@@ -31,13 +65,46 @@ class Melvin:
         self.state_target: Optional[SatStates] = None
         self.transition_time: float = 0.0
 
-        self.vel_plan: Optional[List[tuple[float, float]]] = None
+        self.vel_plan: Optional[VelocityPlan] = None
+
+        self.coverage: CoverageTracker = CoverageTracker()
 
         self.logger: Logger = logging.getLogger(self.__class__.__name__)
         self.sim_duration: timedelta = timedelta(seconds=0)
+        self.simulation_speed: int = 1
+
+        self._snapshot_seq: int = 0
+        self.snapshot: MelvinSnapshot = self.publish_snapshot()
 
         self.logger.info("Melvin initialized. Default start values set.")
 
+    def publish_snapshot(self) -> MelvinSnapshot:
+        """
+        Capture the current state in a new immutable snapshot and publish it.
+
+        Returns:
+            MelvinSnapshot: The published snapshot.
+        """
+        self._snapshot_seq += 1
+        snapshot = MelvinSnapshot(
+            seq=self._snapshot_seq,
+            sim_steps=sim_clock.steps,
+            timestamp=sim_clock.get_time(),
+            sim_duration=self.sim_duration,
+            pos=(self.pos[0], self.pos[1]),
+            vel=(self.vel[0], self.vel[1]),
+            bat=self.bat,
+            fuel=self.fuel,
+            state=self.state,
+            state_target=self.state_target,
+            camera_angle=self.camera_angle,
+            transition_time=self.transition_time,
+            burning=bool(self.vel_plan),
+            simulation_speed=self.simulation_speed,
+        )
+        self.snapshot = snapshot
+        return snapshot
+
     def next_sim_step(self) -> None:
         """
         Advance the simulation by one step.
@@ -58,6 +125,94 @@ class Melvin:
         if self.sim_duration.total_seconds() % self.SIM_DUR_PRINTS == 0:
             self.logger.info(f"Simulation duration: {Helpers.format_sim_duration(self.sim_duration)}")
 
+    def advance(self, duration: float) -> None:
+        """
+        Advance the simulation by a duration, jumping analytically between events.
+
+        Between events (start or end of a transition, end of a burn, empty
+        battery) battery and transition countdown change linearly and position
+        linearly or, during a burn, quadratically, so those stretches are
+        applied in one go. Event steps run through
+        `next_sim_step`, which keeps the result equal to stepping one by one.
+
+        Args:
+            duration (float): Simulation time to advance in seconds, rounded to whole sim steps.
+        """
+        steps = int(round(duration / SIM_STEP_DUR))
+        while steps > 0:
+            quiet = self._quiet_steps(steps)
+            if quiet > 0:
+                self._coast(quiet)
+                steps -= quiet
+            if steps > 0:
+                self.next_sim_step()
+                steps -= 1
+
+    def _quiet_steps(self, limit: int) -> int:
+        """
+        Count the upcoming sim steps without any event.
+
+        Args:
+            limit (int): Maximum number of steps of interest.
+
+        Returns:
+            int: Number of steps (at most limit) that can be applied in closed form.
+        """
+        if self.state_target is not None and self.state != self.state_target and self.state != SatStates.TRANSITION:
+            return 0
+
+        quiet = limit
+        if self.vel_plan:
+            quiet = min(quiet, len(self.vel_plan))
+        if self.transition_time > 0.0:
+            # The countdown reaches zero during step ceil(transition_time / SIM_STEP_DUR)
+            quiet = min(quiet, math.ceil(self.transition_time / SIM_STEP_DUR - 1e-9) - 1)
+
+        bat_rate = self._battery_rate()
+        if bat_rate < 0 and self.state_target != SatStates.SAFE:
+            # The battery runs empty during step ceil(bat / -bat_rate)
+            quiet = min(quiet, math.ceil(self.bat / -bat_rate - 1e-9) - 1)
+
+        return max(0, quiet)
+
+    def _coast(self, steps: int) -> None:
+        """
+        Apply a number of event-free sim steps in closed form.
+
+        Args:
+            steps (int): Number of steps, as returned by `_quiet_steps`.
+        """
+        dt = steps * SIM_STEP_DUR
+        self.bat = Helpers.clamp(self.bat + steps * self._battery_rate(), 0, 100)
+
+        if self.vel_plan:
+            vel_sum = self.vel_plan.velocity_sum(steps)
+            self.pos[0] = Helpers.wrap_coordinate(self.pos[0] + vel_sum[0] * SIM_STEP_DUR, MAP_WIDTH)
+            self.pos[1] = Helpers.wrap_coordinate(self.pos[1] + vel_sum[1] * SIM_STEP_DUR, MAP_HEIGHT)
+            self.vel = list(self.vel_plan.skip(steps))
+            self.fuel -= steps * FUEL_COST
+        else:
+            self.pos[0] = Helpers.wrap_coordinate(self.pos[0] + self.vel[0] * dt, MAP_WIDTH)
+            self.pos[1] = Helpers.wrap_coordinate(self.pos[1] + self.vel[1] * dt, MAP_HEIGHT)
+
+        if self.transition_time > 0.0:
+            self.transition_time -= dt
+
+        prints_before = self.sim_duration.total_seconds() // self.SIM_DUR_PRINTS
+        self.sim_duration += timedelta(seconds=dt)
+        if self.sim_duration.total_seconds() // self.SIM_DUR_PRINTS > prints_before:
+            self.logger.info(f"Simulation duration: {Helpers.format_sim_duration(self.sim_duration)}")
+
+    def _battery_rate(self) -> float:
+        """
+        Returns:
+            float: Battery change per sim step in the current state, including burn cost.
+        """
+        rate = SIM_STEP_DUR * SatStates.get_charge_per_sec(self.state)
+        if self.vel_plan:
+            rate += ADD_BAT_COST_BURN
+        return rate
+
     def update_pos(self) -> None:
         """
         Update Melvin's position using current velocity and simulation time step.
@@ -98,37 +253,43 @@ class Melvin:
         """
         if self.state != self.state_target and self.state_target is not None and self.state != SatStates.TRANSITION:
             self.state = SatStates.TRANSITION
-            self.vel_plan = []
+            self.vel_plan = None
             self.transition_time = Helpers.get_transition_time(self.state, self.state_target)
             self.logger.info(
                 f"Melvin state chang started to {self.state_target.name}. Transition is {self.transition_time}s.")
 
-    def get_observation(self) -> OrderedDict[str, float | int | str | datetime | dict[str, float]]:
+    def get_observation(self, snap: Optional[MelvinSnapshot] = None
+                        ) -> OrderedDict[str, float | int | str | datetime | dict[str, float]]:
         """
-        Collect and return current simulation state as an observation.
+        Collect and return a published state as an observation.
+
+        Args:
+            snap (Optional[MelvinSnapshot]): Snapshot to describe, the latest one if None.
 
         Returns:
             OrderedDict[str, Any]: A dictionary of current values.
         """
+        snap = snap or self.snapshot
+        images_taken, area_covered = self.coverage.get_summary()
         return OrderedDict({
-            "state": self.state.value,
-            "angle": self.camera_angle.value,
-            "simulation_speed": 1,
-            "width_x": int(round(self.pos[0])),
-            "height_y": int(round(self.pos[1])),
-            "vx": round(self.vel[0], 2),
-            "vy": round(self.vel[1], 2),
-            "battery": round(self.bat, 2),
+            "state": snap.state.value,
+            "angle": snap.camera_angle.value,
+            "simulation_speed": snap.simulation_speed,
+            "width_x": int(round(snap.pos[0])),
+            "height_y": int(round(snap.pos[1])),
+            "vx": round(snap.vel[0], 2),
+            "vy": round(snap.vel[1], 2),
+            "battery": round(snap.bat, 2),
             "max_battery": 100.0,
-            "fuel": round(self.fuel, 2),
+            "fuel": round(snap.fuel, 2),
             "distance_covered": 1.0,
-            "area_covered": {"narrow": 0.0, "normal": 0.0, "wide": 0.0},
+            "area_covered": area_covered,
             "data_volume": {"data_volume_sent": 0, "data_volume_received": 0},
-            "images_taken": 0,
+            "images_taken": images_taken,
             "active_time": 0.0,
             "objectives_done": 0,
             "objectives_points": 0,
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+            "timestamp": snap.timestamp.isoformat().replace("+00:00", "Z")
 
         })
 
@@ -142,10 +303,37 @@ class Melvin:
         self.fuel = START_FUEL
         self.state = SatStates.DEPLOYMENT
         self.state_target = None
+        self.transition_time = 0.0
+        self.vel_plan = None
         self.camera_angle = CameraAngle.NORMAL
+        self.coverage.reset()
         obj_manager.delete_all()
         self.logger.info("Melvin reset.")
 
+    def record_image(self, snap: MelvinSnapshot, pos: tuple[int, int]) -> None:
+        """
+        Account for an image served at the given position.
+        Only images taken in acquisition count towards the covered map and zone area.
+
+        Args:
+            snap (MelvinSnapshot): Snapshot the image was taken from.
+            pos (tuple[int, int]): Rounded (x, y) position the image was taken at.
+        """
+        if snap.state == SatStates.ACQUISITION:
+            self.coverage.record_image(pos, snap.camera_angle)
+            obj_manager.record_footprint(pos, snap.camera_angle)
+
+    def set_simulation_speed(self, speed: int) -> None:
+        """
+        Set the number of simulated seconds per wall-clock second.
+        The simulation engine applies it to physics and clock alike.
+
+        Args:
+            speed (int): Speed factor between 1 and MAX_SIMULATION_SPEED.
+        """
+        self.simulation_speed = speed
+        self.logger.info(f"Simulation speed set to {speed}x")
+
     def update_state(self, state: SatStates) -> None:
         """
         Set the satellite's next target state.
@@ -182,7 +370,7 @@ class Melvin:
         Returns:
             bool: True when velocity plan has been accepted.
         """
-        self.vel_plan = Helpers.validate_velocity_change(self.vel, target_vel)  # list of (vx, vy) steps
+        self.vel_plan = Helpers.validate_velocity_change(self.vel, target_vel)
         self.logger.info(f"[Melvin] Velocity plan accepted: {len(self.vel_plan)} steps")
         return True
 
@@ -191,23 +379,10 @@ class Melvin:
         Apply the next step in the velocity plan.
         """
         if self.vel_plan:
-            next_v = self.vel_plan.pop(0)
+            next_v = self.vel_plan.next()
             self.vel = list(next_v)
         else:
             self.logger.info(f"[Melvin] Velocity plan finished, velocity is {self.vel}.")
 
 
 melvin = Melvin()
-
-
-def background_updater() -> None:
-    """
-    Continuously update the simulation in a background thread.
-    """
-    while True:
-        next_update_time = datetime.now(timezone.utc) + timedelta(seconds=SIM_STEP_DUR)
-        melvin.next_sim_step()
-        time.sleep(next_update_time.timestamp() - time.time())
-
-
-threading.Thread(target=background_updater, daemon=True).start()
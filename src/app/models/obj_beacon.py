@@ -1,5 +1,5 @@
 import random
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from dataclasses import dataclass
 from typing import Tuple, TypedDict
 
@@ -61,18 +61,19 @@ class BeaconObjective:
         }
 
     @staticmethod
-    def create_randomized(rand_beac_id: int) -> "BeaconObjective":
+    def create_randomized(rand_beac_id: int, now: datetime) -> "BeaconObjective":
         """
         Create a randomized BeaconObjective with future start/end times and random coordinates.
 
         Args:
             rand_beac_id (int): The unique ID for the beacon.
+            now (datetime): Current simulation time.
 
         Returns:
             BeaconObjective: A newly created random beacon objective.
         """
 
-        start = datetime.now(timezone.utc) + timedelta(hours=float(random.randint(1, 3)))
+        start = now + timedelta(hours=float(random.randint(1, 3)))
         end = start + timedelta(hours=4.0)
 
         return BeaconObjective(
@@ -1,37 +1,105 @@
-import random
+import json
+import logging
+import threading
 from datetime import datetime
-from typing import List, Union, Set, Dict
+from typing import List, Union, Dict, Optional, Tuple, KeysView
 
-from src.app.models.obj_beacon import BeaconObjective, BeaconObjectiveDict, BeaconObjectiveFullDict
+from src.app.constants import CameraAngle
+from src.app.helpers import Helpers
+from src.app.image_loader import apply_map_overlay, remove_map_overlay, clear_map_overlays
+from src.app.models.beacon_columns import BeaconColumns
+from src.app.models.obj_beacon import BeaconObjective, BeaconObjectiveFullDict
 from src.app.models.obj_zoned import ZonedObjective, ZonedObjectiveDict
+from src.app.models.objective_schedule import ObjectiveSchedule
+from src.app.models.spatial_index import SpatialGrid
+from src.app.sim_clock import sim_clock
+
+logger = logging.getLogger(__name__)
+
+Objective = Union[BeaconObjective, ZonedObjective]
+
+
+class IdAllocator:
+    """
+    Hands out increasing objective IDs, skipping IDs that are already taken.
+
+    IDs are never reused, so every call only has to step over manually
+    assigned IDs once and allocation never loops forever.
+    """
+
+    def __init__(self, first_id: int = 1) -> None:
+        self.first_id: int = first_id
+        self._next_id: int = first_id
+
+    def allocate(self, taken: KeysView[int]) -> int:
+        """
+        Args:
+            taken (KeysView[int]): IDs currently in use.
+
+        Returns:
+            int: The lowest unused ID above all previously allocated ones.
+        """
+        while self._next_id in taken:
+            self._next_id += 1
+        self._next_id += 1
+        return self._next_id - 1
+
+    def reset(self) -> None:
+        self._next_id = self.first_id
 
 
 class ObjManager:
     """
     Manages creation, storage, and deletion of all objective types in the simulation.
+
+    Objectives are indexed by ID, overall and per type, in insertion order,
+    so lookup, insert and delete are O(1). Zones and beacon positions are also
+    kept in spatial grids for footprint and radius queries. The time windows
+    are tracked by a schedule that the simulation engine advances every step:
+    it maintains the set of active objectives and deletes expired ones.
+    The API representation of every objective is serialized once when it is
+    stored, and the full GET /objective body is cached per registry version.
+    All access goes through a lock because objectives are read and written
+    from request threads and the simulation thread.
     """
 
     def __init__(self) -> None:
-        self.obj_list: List[Union[BeaconObjective, ZonedObjective]] = []
-        self.existing_ids: Set[int] = set()
-        self.beacon_list: List[BeaconObjective] = []
-        self.zoned_list: List[ZonedObjective] = []
+        self.objectives: Dict[int, Objective] = {}
+        self.beacons: Dict[int, BeaconObjective] = {}
+        self.zoned: Dict[int, ZonedObjective] = {}
+        self.beacon_columns: BeaconColumns = BeaconColumns()
+        self.zone_index: SpatialGrid = SpatialGrid()
+        self.beacon_index: SpatialGrid = SpatialGrid()
+        self.schedule: ObjectiveSchedule = ObjectiveSchedule()
+        self.id_allocator: IdAllocator = IdAllocator()
+        self.version: int = 0
+        self._fragments: Dict[int, str] = {}
+        self._payload: Tuple[int, bytes] = (-1, b"")
+        self._lock = threading.RLock()
 
-    def get_all_objectives(self) -> Dict[str, List[ZonedObjectiveDict | BeaconObjectiveDict]]:
+    def get_objectives_payload(self) -> Tuple[int, bytes]:
         """
-        Return all objectives, grouped by type.
+        Return the serialized GET /objective body, rebuilt only if objectives changed since the last call.
+
+        The body is joined from the JSON fragments serialized when each
+        objective was stored.
 
         Returns:
-            Dict[str, List[Dict[str, Any]]]: Grouped objectives for API responses.
+            Tuple[int, bytes]: Registry version the body belongs to, and the JSON body.
         """
-        return {
-            "zoned_objectives": [z.info_to_endpoint() for z in self.zoned_list],
-            "beacon_objectives": [b.info_to_endpoint() for b in self.beacon_list]
-        }
+        payload = self._payload
+        if payload[0] == self.version:
+            return payload
+        with self._lock:
+            beacons = ",".join(self._fragments[obj_id] for obj_id in self.beacons)
+            zoned = ",".join(self._fragments[obj_id] for obj_id in self.zoned)
+            body = f'{{"beacon_objectives":[{beacons}],"zoned_objectives":[{zoned}]}}\n'.encode()
+            self._payload = payload = (self.version, body)
+        return payload
 
     def create_random_zoned_objective(self, num: int) -> List[ZonedObjective]:
         """
-        Create a given number of unique randomized ZonedObjectives.
+        Create a given number of unique randomized ZonedObjectives, starting at the current simulation time.
 
         Args:
             num (int): Number of objectives to generate.
@@ -40,23 +108,17 @@ class ObjManager:
             List[ZonedObjective]: List of created ZonedObjective instances.
         """
         new_zo_objs: List[ZonedObjective] = []
-        for _ in range(num):
-            while True:
-                obj_id = random.randint(1, 100)
-                if obj_id not in self.existing_ids:
-                    new_zo = ZonedObjective.create_randomized(obj_id)
-                    self.zoned_list.append(new_zo)
-                    self.obj_list.append(self.zoned_list[-1])
-                    self.existing_ids.add(new_zo.id)
-                    new_zo_objs.append(self.zoned_list[-1])
-                    # apply_map_overlay(new_zo.overlay)
-                    break
-        # TODO: create images for objective
+        now = sim_clock.get_time()
+        with self._lock:
+            for _ in range(num):
+                new_zo = ZonedObjective.create_randomized(self.id_allocator.allocate(self.objectives.keys()), now)
+                self._add_zoned(new_zo)
+                new_zo_objs.append(new_zo)
         return new_zo_objs
 
     def create_random_beacon_objective(self, num: int) -> List[BeaconObjective]:
         """
-        Create a given number of unique randomized BeaconObjectives.
+        Create a given number of unique randomized BeaconObjectives, relative to the current simulation time.
 
         Args:
             num (int): Number of objectives to generate.
@@ -65,17 +127,12 @@ class ObjManager:
             List[BeaconObjective]: List of created BeaconObjective instances.
         """
         new_beacons = []
-        for _ in range(num):
-            while True:
-                obj_id = random.randint(1, 100)
-                if obj_id not in self.existing_ids:
-                    new_bo = BeaconObjective.create_randomized(obj_id)
-                    self.beacon_list.append(new_bo)
-                    self.obj_list.append(self.beacon_list[-1])
-                    self.existing_ids.add(new_bo.id)
-                    new_beacons.append(self.beacon_list[-1])
-                    break
-
+        now = sim_clock.get_time()
+        with self._lock:
+            for _ in range(num):
+                new_bo = BeaconObjective.create_randomized(self.id_allocator.allocate(self.objectives.keys()), now)
+                self._add_beacon(new_bo)
+                new_beacons.append(new_bo)
         return new_beacons
 
     def create_beacon_from_dict(self, beacon_dict: BeaconObjectiveFullDict) -> BeaconObjective:
@@ -87,45 +144,76 @@ class ObjManager:
 
         Returns:
             BeaconObjective: The created instance.
+
+        Raises:
+            ValueError: If an objective with the same ID already exists.
+        """
+        new_beac = ObjManager.build_beacon_from_dict(beacon_dict)
+        with self._lock:
+            self._check_id_free(new_beac.id)
+            self._add_beacon(new_beac)
+        return new_beac
+
+    def create_zoned_from_dict(self, zoned_dict: ZonedObjectiveDict) -> ZonedObjective:
+        """
+        Create a ZonedObjective from dictionary data (e.g., from JSON).
+
+        Args:
+            zoned_dict (Dict[str, Any]): Dictionary with zoned objective data.
+
+        Returns:
+            ZonedObjective: The created instance.
+
+        Raises:
+            ValueError: If an objective with the same ID already exists.
+        """
+        new_zoned = ObjManager.build_zoned_from_dict(zoned_dict)
+        with self._lock:
+            self._check_id_free(new_zoned.id)
+            self._add_zoned(new_zoned)
+        return new_zoned
+
+    @staticmethod
+    def build_beacon_from_dict(beacon_dict: BeaconObjectiveFullDict) -> BeaconObjective:
         """
-        start = datetime.fromisoformat(beacon_dict["start"].replace("Z", "+00:00"))
-        end = datetime.fromisoformat(beacon_dict["end"].replace("Z", "+00:00"))
+        Build a BeaconObjective from dictionary data without storing it.
 
-        new_beac = BeaconObjective(
+        Args:
+            beacon_dict (Dict[str, Any]): Dictionary with beacon data.
+
+        Returns:
+            BeaconObjective: The new instance.
+        """
+        return BeaconObjective(
             id=beacon_dict["id"],
             name=beacon_dict["name"],
-            start=start,
-            end=end,
+            start=datetime.fromisoformat(beacon_dict["start"]),
+            end=datetime.fromisoformat(beacon_dict["end"]),
             decrease_rate=beacon_dict["decrease_rate"],
             attempts_made=beacon_dict["attempts_made"],
             description=beacon_dict["description"],
             height=beacon_dict["beacon_height"],
             width=beacon_dict["beacon_width"]
         )
-        self.obj_list.append(new_beac)
-        self.beacon_list.append(new_beac)
-        return new_beac
 
-    def create_zoned_from_dict(self, zoned_dict: ZonedObjectiveDict) -> ZonedObjective:
+    @staticmethod
+    def build_zoned_from_dict(zoned_dict: ZonedObjectiveDict) -> ZonedObjective:
         """
-        Create a ZonedObjective from dictionary data (e.g., from JSON).
+        Build a ZonedObjective from dictionary data without storing it.
 
         Args:
             zoned_dict (Dict[str, Any]): Dictionary with zoned objective data.
 
         Returns:
-            ZonedObjective: The created instance.
+            ZonedObjective: The new instance.
         """
-        start = datetime.fromisoformat(zoned_dict["start"].replace("Z", "+00:00"))
-        end = datetime.fromisoformat(zoned_dict["end"].replace("Z", "+00:00"))
         if isinstance(zoned_dict["zone"], str):
-            raise KeyError("zone must be a list of (int) coordinates")
-        # overlay = ZonedObjective.get_overlay(zoned_dict["zone"])
-        new_zoned = ZonedObjective(
+            raise ValueError("zone must be a list of (int) coordinates")
+        return ZonedObjective(
             id=zoned_dict["id"],
             name=zoned_dict["name"],
-            start=start,
-            end=end,
+            start=datetime.fromisoformat(zoned_dict["start"]),
+            end=datetime.fromisoformat(zoned_dict["end"]),
             decrease_rate=zoned_dict["decrease_rate"],
             zone=zoned_dict["zone"],
             optic_required=zoned_dict["optic_required"],
@@ -133,13 +221,133 @@ class ObjManager:
             description=zoned_dict["description"],
             sprite=zoned_dict["sprite"],
             secret=zoned_dict["secret"],
-            overlay=None
+            overlay=ZonedObjective.get_overlay(zoned_dict["zone"])
         )
-        self.obj_list.append(new_zoned)
-        self.zoned_list.append(new_zoned)
-        # apply_map_overlay(new_zoned.overlay)
-        # TODO: generate image for objective
-        return new_zoned
+
+    def add_objectives(self, objectives: List[Objective]) -> List[Optional[str]]:
+        """
+        Store a batch of built objectives in one operation.
+
+        Args:
+            objectives (List[Union[BeaconObjective, ZonedObjective]]): Objectives to store.
+
+        Returns:
+            List[Optional[str]]: Per objective, None if stored or the reason it was rejected.
+        """
+        errors: List[Optional[str]] = []
+        with self._lock:
+            for obj in objectives:
+                if obj.id in self.objectives:
+                    errors.append(f"An objective with ID {obj.id} already exists.")
+                    continue
+                if isinstance(obj, BeaconObjective):
+                    self._add_beacon(obj)
+                else:
+                    self._add_zoned(obj)
+                errors.append(None)
+        return errors
+
+    def get_objective_by_id(self, obj_id: int) -> Optional[Objective]:
+        """
+        Look up an objective by its ID.
+
+        Args:
+            obj_id (int): The objective ID.
+
+        Returns:
+            Optional[Union[BeaconObjective, ZonedObjective]]: The objective, or None if not found.
+        """
+        return self.objectives.get(obj_id)
+
+    def get_beacon_by_id(self, beacon_id: int) -> Optional[BeaconObjective]:
+        """
+        Look up a beacon objective by its ID.
+
+        Args:
+            beacon_id (int): The beacon ID.
+
+        Returns:
+            Optional[BeaconObjective]: The beacon, or None if there is no beacon with that ID.
+        """
+        return self.beacons.get(beacon_id)
+
+    def record_beacon_guess(self, beacon: BeaconObjective) -> int:
+        """
+        Count a position guess on a beacon and re-serialize it for GET /objective.
+
+        Attempts live on the beacon itself, so they are deleted with it and a
+        reused ID starts from zero again.
+
+        Args:
+            beacon (BeaconObjective): The guessed beacon.
+
+        Returns:
+            int: Attempts made on the beacon, including this one.
+        """
+        with self._lock:
+            beacon.attempts_made += 1
+            if self.beacons.get(beacon.id) is beacon:
+                self._store_fragment(beacon)
+            return beacon.attempts_made
+
+    def record_footprint(self, center: Tuple[int, int], angle: CameraAngle) -> None:
+        """
+        Add an image footprint to the coverage of all active zoned objectives requiring its optic.
+
+        Args:
+            center (Tuple[int, int]): (x, y) center of the image on the map.
+            angle (CameraAngle): Camera angle the image was taken with.
+        """
+        size = angle.get_side_length()
+        left, top = center[0] - size // 2, center[1] - size // 2
+        with self._lock:
+            for zoned in self.get_zones_in_rect(left, top, size, size):
+                if zoned.optic_required == angle.value and zoned.id in self.schedule.active:
+                    zoned.coverage.record_footprint(left, top, size)
+
+    def get_zones_in_rect(self, left: int, top: int, width: int, height: int) -> List[ZonedObjective]:
+        """
+        Find the zoned objectives whose zone overlaps a rectangle, wrapping around the map seams.
+
+        Args:
+            left (int): Left edge on the map.
+            top (int): Top edge on the map.
+            width (int): Width of the rectangle.
+            height (int): Height of the rectangle.
+
+        Returns:
+            List[ZonedObjective]: Overlapping objectives in creation order.
+        """
+        with self._lock:
+            return [self.zoned[obj_id] for obj_id in self.zone_index.query_rect(left, top, width, height)]
+
+    def get_beacons_in_radius(self, center: Tuple[float, float], radius: float) -> List[BeaconObjective]:
+        """
+        Find the beacons within a wrapped distance of a point.
+
+        Args:
+            center (Tuple[float, float]): (x, y) center of the search.
+            radius (float): Search radius.
+
+        Returns:
+            List[BeaconObjective]: Beacons in range in creation order.
+        """
+        with self._lock:
+            return [self.beacons[obj_id] for obj_id in self.beacon_index.query_radius(center[0], center[1], radius)]
+
+    def advance_time(self, now: datetime) -> None:
+        """
+        Advance the objective schedule to the current simulation time and delete expired objectives.
+
+        Args:
+            now (datetime): Current simulation time.
+        """
+        with self._lock:
+            activated, expired = self.schedule.advance(now)
+            for obj_id in expired:
+                self.delete_objective_by_id(obj_id)
+        if activated or expired:
+            logger.info(f"Objectives activated: {activated}, expired: {expired}")
 
     def delete_objective_by_id(self, obj_id: int) -> bool:
         """
@@ -151,25 +359,80 @@ class ObjManager:
         Returns:
             bool: True if deleted, False if not found.
         """
-        remaining_obj = self.obj_list.copy()
-        for obj in remaining_obj:
-            if obj.id == obj_id:
-                self.obj_list.remove(obj)
-                if isinstance(obj, BeaconObjective):
-                    self.beacon_list.remove(obj)
-                else:
-                    self.zoned_list.remove(obj)
-                    # remove_map_overlay(obj.overlay)
-                return True
-        return False
+        with self._lock:
+            obj = self.objectives.pop(obj_id, None)
+            if obj is None:
+                return False
+            del self._fragments[obj_id]
+            self.version += 1
+            self.schedule.remove(obj_id)
+            if isinstance(obj, BeaconObjective):
+                del self.beacons[obj_id]
+                self.beacon_columns.remove(obj_id)
+                self.beacon_index.remove(obj_id)
+            else:
+                del self.zoned[obj_id]
+                self.zone_index.remove(obj_id)
+                if obj.overlay is not None:
+                    self._remove_overlay(obj)
+            return True
 
     def delete_all(self) -> None:
         """
         Clear all objectives and reset state.
         """
-        self.obj_list = []
-        self.zoned_list = []
-        self.beacon_list = []
+        with self._lock:
+            self.objectives.clear()
+            self._fragments.clear()
+            self.version += 1
+            self.zoned.clear()
+            self.beacons.clear()
+            self.beacon_columns.clear()
+            self.zone_index.clear()
+            self.beacon_index.clear()
+            self.schedule.clear()
+            self.id_allocator.reset()
+            clear_map_overlays()
+
+    def _check_id_free(self, obj_id: int) -> None:
+        if obj_id in self.objectives:
+            raise ValueError(f"An objective with ID {obj_id} already exists.")
+
+    def _store_fragment(self, obj: Objective) -> None:
+        self._fragments[obj.id] = json.dumps(obj.info_to_endpoint(), sort_keys=True, separators=(",", ":"))
+        self.version += 1
+
+    def _add_beacon(self, beacon: BeaconObjective) -> None:
+        self.objectives[beacon.id] = beacon
+        self._store_fragment(beacon)
+        self.beacons[beacon.id] = beacon
+        self.beacon_columns.add(beacon)
+        self.beacon_index.insert_point(beacon.id, beacon.width, beacon.height)
+        self.schedule.add(beacon.id, beacon.start, beacon.end)
 
+    def _add_zoned(self, zoned: ZonedObjective) -> None:
+        self.objectives[zoned.id] = zoned
+        self._store_fragment(zoned)
+        self.zoned[zoned.id] = zoned
+        self.zone_index.insert(zoned.id, zoned.zone[0], zoned.zone[1], *Helpers.get_zone_size(zoned.zone))
+        self.schedule.add(zoned.id, zoned.start, zoned.end)
+        if zoned.overlay is not None:
+            apply_map_overlay(zoned.overlay, zoned.zone)
+
+    def _remove_overlay(self, removed: ZonedObjective) -> None:
+        """
+        Restore the map under a zone and repaint the overlapping overlays of the remaining zones.
+
+        The remaining overlays are repainted in creation order and clipped to
+        the restored zone, which reproduces the map as if the removed zone had
+        never been painted.
+
+        Args:
+            removed (ZonedObjective): The objective whose overlay is removed.
+        """
+        remove_map_overlay(removed.zone)
+        for other in self.get_zones_in_rect(removed.zone[0], removed.zone[1], *Helpers.get_zone_size(removed.zone)):
+            if other.overlay is not None:
+                apply_map_overlay(other.overlay, other.zone, clip=removed.zone)
 
 obj_manager = ObjManager()
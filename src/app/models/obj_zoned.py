@@ -1,14 +1,14 @@
-import logging
 import random
-from datetime import datetime, timedelta, timezone
-from dataclasses import dataclass
+from datetime import datetime, timedelta
+from dataclasses import dataclass, field
 from typing import Optional, List, Dict, TypedDict, Union
 from ..helpers import Helpers
 
 from PIL import Image
 
 from src.app.constants import MAP_WIDTH, MAP_HEIGHT, CameraAngle
-from ..image_loader import get_obj_img, PADDING
+from src.app.models.coverage import ZoneCoverage
+from ..image_loader import get_obj_sprite
 
 ZONED__DESCRIPTIONS: List[str] = [
     "Scout the land between the mountains. Something stirs in the shadows.",
@@ -51,6 +51,10 @@ class ZonedObjective:
     sprite: Optional[str]
     secret: bool
     overlay: Optional[Image.Image]
+    coverage: ZoneCoverage = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.coverage = ZoneCoverage(self.zone)
 
     def to_dict(self) -> ZonedObjectiveDict:
         """
@@ -74,17 +78,18 @@ class ZonedObjective:
         }
 
     @staticmethod
-    def create_randomized(rand_zo_id: int) -> "ZonedObjective":
+    def create_randomized(rand_zo_id: int, now: datetime) -> "ZonedObjective":
         """
         Create a randomized ZonedObjective.
 
         Args:
             rand_zo_id (int): Unique ID for the objective.
+            now (datetime): Current simulation time, the start of the objective.
 
         Returns:
             ZonedObjective: A new instance with randomized parameters.
         """
-        start = datetime.now(timezone.utc)  # + timedelta(hours=float(random.randint(1, 3)))
+        start = now  # + timedelta(hours=float(random.randint(1, 3)))
         end = start + timedelta(hours=float(random.randint(2, 6)))
 
         rand_x_coord: int = random.randint(0, MAP_WIDTH - 1)
@@ -101,7 +106,6 @@ class ZonedObjective:
         rand_zone: list[int] = [rand_x_coord, rand_y_coord, x_end, y_end]
 
         rand_coverage = round(random.uniform(0.6, 1.0), 2)
-        # overlay = ZonedObjective.get_overlay(rand_zone)
         return ZonedObjective(
             id=rand_zo_id,
             name=f"Precise Picture {rand_zo_id}",
@@ -114,70 +118,27 @@ class ZonedObjective:
             description=random.choice(ZONED__DESCRIPTIONS),
             sprite=None,
             secret=False,  # TODO: implement secret objectives?
-            overlay=None
+            overlay=ZonedObjective.get_overlay(rand_zone)
         )
 
     @staticmethod
     def get_overlay(zone: list[int]) -> Optional[Image.Image]:
         """
-        Generate an overlay image for the specified zone.
+        Generate the overlay sprite for the specified zone.
+
+        The sprite only covers the zone itself; wrapping around the map seams is
+        handled when it is applied to the map.
 
         Args:
             zone (List[int]): [x1, y1, x2, y2] coordinates.
 
         Returns:
-            Optional[Image.Image]: The resulting overlay image.
+            Optional[Image.Image]: The RGBA sprite sized like the zone, None for an empty zone.
         """
-        if zone[2] < zone[0]:
-            width = zone[2] + MAP_WIDTH - zone[0]
-        else:
-            width = zone[2] - zone[0]
-        if zone[3] < zone[1]:
-            height = zone[3] + MAP_HEIGHT - zone[1]
-        else:
-            height = zone[3] - zone[1]
-        obj_img = get_obj_img().copy().resize((width, height), Image.Resampling.LANCZOS)
-        overlay = Image.new("RGBA", (MAP_WIDTH + 2 * PADDING, MAP_HEIGHT + 2 * PADDING), (0, 0, 0, 0))
-        insert_pos = (zone[0] + PADDING, zone[1] + PADDING)
-        overlay.paste(obj_img, insert_pos)
-        if zone[2] < zone[0]:
-            # Copy left outer rim to account for wrapping
-            crop_box_x = (MAP_WIDTH, PADDING, MAP_WIDTH + PADDING, MAP_HEIGHT + PADDING)
-            x_new_pos = (PADDING, PADDING)
-            crop_x_slice = overlay.crop(crop_box_x)
-            overlay.paste(crop_x_slice, x_new_pos)
-        if zone[3] < zone[1]:
-            crop_box_y = (PADDING, MAP_HEIGHT, MAP_WIDTH + PADDING, MAP_HEIGHT + PADDING)
-            crop_y_slice = overlay.crop(crop_box_y)
-            y_new_pos = (PADDING, 0)
-            overlay.paste(crop_y_slice, y_new_pos)
-        if zone[2] < zone[0] and zone[3] < zone[1]:
-            crop_box_x_y = (MAP_WIDTH, MAP_HEIGHT, MAP_WIDTH + PADDING, MAP_HEIGHT + PADDING)
-            crop_x_y_slice = overlay.crop(crop_box_x_y)
-            x_y_new_pos = (PADDING, PADDING)
-            overlay.paste(crop_x_y_slice, x_y_new_pos)
-
-        # left
-        overlay.paste(
-            overlay.crop((MAP_WIDTH - PADDING, 0, MAP_WIDTH, MAP_HEIGHT - 1)),
-            (0, PADDING),
-        )
-        # right
-        overlay.paste(
-            overlay.crop((0, 0, PADDING, MAP_HEIGHT)), (MAP_WIDTH + PADDING, PADDING)
-        )
-        # top
-        overlay.paste(
-            overlay.crop((0, MAP_HEIGHT, MAP_WIDTH + (2 * PADDING), MAP_HEIGHT + PADDING)),
-            (0, 0),
-        )
-        # bottom
-        overlay.paste(
-            overlay.crop((0, 0, MAP_WIDTH + (2 * PADDING), PADDING)),
-            (0, MAP_HEIGHT + PADDING),
-        )
-        logging.getLogger(__name__).info(f"width: {overlay.width}, height: {overlay.height}")
-        return overlay
+        width, height = Helpers.get_zone_size(zone)
+        if width == 0 or height == 0:
+            return None
+        return get_obj_sprite(width, height)
 
     def info_to_endpoint(self) -> ZonedObjectiveDict:
         """
@@ -0,0 +1,88 @@
+import heapq
+from datetime import datetime
+from typing import Dict, List, Set, Tuple
+
+
+class ObjectiveSchedule:
+    """
+    Time-window index over objectives, advanced along the simulation timeline.
+
+    Pending start times and end times are kept in two min-heaps. `advance`
+    pops the windows that opened or closed since the last call, so the set of
+    active objectives is maintained incrementally instead of evaluating
+    `is_active` for every objective. Every scheduled window gets a new
+    generation number; heap entries of removed or replaced windows carry an
+    outdated one and are skipped when popped.
+    """
+
+    def __init__(self) -> None:
+        self.active: Set[int] = set()
+        self._windows: Dict[int, Tuple[float, float, int]] = {}
+        self._starts: List[Tuple[float, int, int]] = []
+        self._ends: List[Tuple[float, int, int]] = []
+        self._now: float = float("-inf")
+        self._generation: int = 0
+
+    def add(self, obj_id: int, start: datetime, end: datetime) -> None:
+        """
+        Schedule the time window of an objective, replacing any previous one.
+
+        Args:
+            obj_id (int): ID of the objective.
+            start (datetime): Start of the window.
+            end (datetime): End of the window, inclusive.
+        """
+        self._generation += 1
+        window = (start.timestamp(), end.timestamp(), self._generation)
+        self._windows[obj_id] = window
+        self.active.discard(obj_id)
+        if window[0] <= self._now:
+            if self._now <= window[1]:
+                self.active.add(obj_id)
+        else:
+            heapq.heappush(self._starts, (window[0], obj_id, window[2]))
+        heapq.heappush(self._ends, (window[1], obj_id, window[2]))
+
+    def remove(self, obj_id: int) -> None:
+        self._windows.pop(obj_id, None)
+        self.active.discard(obj_id)
+
+    def clear(self) -> None:
+        self.active.clear()
+        self._windows.clear()
+        self._starts.clear()
+        self._ends.clear()
+
+    def advance(self, now: datetime) -> Tuple[List[int], List[int]]:
+        """
+        Move the schedule to a new simulation time.
+
+        Args:
+            now (datetime): Current simulation time, never earlier than the last call.
+
+        Returns:
+            Tuple[List[int], List[int]]: IDs of the objectives that became active
+                and of those whose window ended since the last call.
+        """
+        self._now = now.timestamp()
+        activated: List[int] = []
+        expired: List[int] = []
+
+        while self._starts and self._starts[0][0] <= self._now:
+            _, obj_id, generation = heapq.heappop(self._starts)
+            window = self._windows.get(obj_id)
+            if window is None or window[2] != generation:
+                continue
+            if self._now <= window[1]:
+                self.active.add(obj_id)
+                activated.append(obj_id)
+
+        while self._ends and self._ends[0][0] < self._now:
+            _, obj_id, generation = heapq.heappop(self._ends)
+            window = self._windows.get(obj_id)
+            if window is None or window[2] != generation:
+                continue
+            self.active.discard(obj_id)
+            expired.append(obj_id)
+
+        return activated, expired
@@ -0,0 +1,87 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any, Iterable, List, Tuple, TypedDict, Union
+
+from src.app.models.obj_manager import ObjManager, Objective, obj_manager
+
+
+class RecordError(TypedDict):
+    line: int
+    error: str
+
+
+@dataclass
+class ImportResult:
+    """
+    Outcome of a scenario import.
+    """
+    imported_ids: List[int] = field(default_factory=list)
+    errors: List[RecordError] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "imported": len(self.imported_ids),
+            "failed": len(self.errors),
+            "imported_ids": self.imported_ids,
+            "errors": self.errors,
+        }
+
+
+def build_objective(record: dict[str, Any]) -> Objective:
+    """
+    Build an objective from one scenario record.
+
+    A record has the fields of a manual objective of PUT /objective plus a
+    "type" field, either "zoned" or "beacon".
+
+    Raises:
+        ValueError: If the type is unknown or a field is invalid.
+        KeyError: If a required field is missing.
+    """
+    record_type = record.get("type")
+    if record_type == "zoned":
+        return ObjManager.build_zoned_from_dict(record)  # type: ignore[arg-type]
+    if record_type == "beacon":
+        return ObjManager.build_beacon_from_dict(record)  # type: ignore[arg-type]
+    raise ValueError(f"Unknown objective type {record_type!r}, expected 'zoned' or 'beacon'.")
+
+
+def import_ndjson(lines: Iterable[Union[bytes, str]], manager: ObjManager = obj_manager) -> ImportResult:
+    """
+    Import objectives from NDJSON lines, one objective record per line.
+
+    Lines are parsed and validated as they stream in. Records that fail are
+    reported with their line number and do not stop the import. All valid
+    objectives are stored in a single registry operation at the end.
+
+    Args:
+        lines (Iterable[Union[bytes, str]]): NDJSON lines, e.g. a request stream or an open file.
+        manager (ObjManager): Registry to store the objectives in.
+
+    Returns:
+        ImportResult: IDs of the stored objectives and per-record errors.
+    """
+    result = ImportResult()
+    built: List[Tuple[int, Objective]] = []
+
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("Record must be a JSON object.")
+            built.append((line_no, build_objective(record)))
+        except KeyError as e:
+            result.errors.append({"line": line_no, "error": f"Missing field {e}."})
+        except Exception as e:
+            result.errors.append({"line": line_no, "error": str(e)})
+
+    for (line_no, obj), error in zip(built, manager.add_objectives([obj for _, obj in built])):
+        if error is None:
+            result.imported_ids.append(obj.id)
+        else:
+            result.errors.append({"line": line_no, "error": error})
+
+    result.errors.sort(key=lambda record_error: record_error["line"])
+    return result
@@ -0,0 +1,135 @@
+import itertools
+from typing import Dict, Iterator, List, Set, Tuple
+
+from src.app.constants import MAP_WIDTH, MAP_HEIGHT, SPATIAL_GRID_CELL_SIZE
+from src.app.helpers import Helpers
+from src.app.map_store import wrapped_spans
+
+# (left, top, width, height) on the map, wrapping around the seams
+Rect = Tuple[int, int, int, int]
+
+
+class SpatialGrid:
+    """
+    Uniform grid over the toroidal map indexing rectangles by key.
+
+    Every entry is registered in all cells its rectangle touches, with the
+    rectangle split at the map seams first, so wrapping zones are found from
+    both sides. Queries only visit the cells under the query area and then
+    test the candidates exactly.
+    """
+
+    def __init__(self, cell_size: int = SPATIAL_GRID_CELL_SIZE) -> None:
+        self.cell_size: int = cell_size
+        self._cells: Dict[Tuple[int, int], Set[int]] = {}
+        self._rects: Dict[int, Rect] = {}
+        self._seq: Dict[int, int] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def insert(self, key: int, left: int, top: int, width: int, height: int) -> None:
+        """
+        Index a rectangle, replacing any previous entry with the same key.
+
+        Args:
+            key (int): Entry key, e.g. an objective ID.
+            left (int): Left edge on the map.
+            top (int): Top edge on the map.
+            width (int): Width, at most the map width.
+            height (int): Height, at most the map height.
+        """
+        self.remove(key)
+        rect = (left % MAP_WIDTH, top % MAP_HEIGHT, width, height)
+        self._rects[key] = rect
+        self._seq[key] = next(self._counter)
+        for cell in self._cells_in(*rect):
+            self._cells.setdefault(cell, set()).add(key)
+
+    def insert_point(self, key: int, x: int, y: int) -> None:
+        self.insert(key, x, y, 1, 1)
+
+    def remove(self, key: int) -> bool:
+        """
+        Returns:
+            bool: True if the key was indexed.
+        """
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return False
+        del self._seq[key]
+        for cell in self._cells_in(*rect):
+            keys = self._cells.get(cell)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self._cells[cell]
+        return True
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._rects.clear()
+        self._seq.clear()
+
+    def query_rect(self, left: int, top: int, width: int, height: int) -> List[int]:
+        """
+        Find the entries overlapping a rectangle.
+
+        Args:
+            left (int): Left edge on the map.
+            top (int): Top edge on the map.
+            width (int): Width, at most the map width.
+            height (int): Height, at most the map height.
+
+        Returns:
+            List[int]: Keys of the overlapping entries, in insertion order.
+        """
+        hits = []
+        for key in self._candidates(left, top, width, height):
+            x, y, w, h = self._rects[key]
+            if Helpers.ring_overlaps(left, width, x, w, MAP_WIDTH) and \
+                    Helpers.ring_overlaps(top, height, y, h, MAP_HEIGHT):
+                hits.append(key)
+        return sorted(hits, key=self._seq.__getitem__)
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[int]:
+        """
+        Find the entries whose top-left corner (the position of point entries)
+        lies within a wrapped distance of a point.
+
+        Args:
+            x (float): Center x.
+            y (float): Center y.
+            radius (float): Search radius.
+
+        Returns:
+            List[int]: Keys of the entries in range, in insertion order.
+        """
+        left, top = int(x - radius), int(y - radius)
+        size = int(2 * radius) + 2
+        candidates = list(self._candidates(left, top, min(size, MAP_WIDTH), min(size, MAP_HEIGHT)))
+        if not candidates:
+            return []
+        corners = [self._rects[key][:2] for key in candidates]
+        distances = Helpers.wrapped_distances((x, y), corners)
+        hits = [key for key, distance in zip(candidates, distances) if distance <= radius]
+        return sorted(hits, key=self._seq.__getitem__)
+
+    def _candidates(self, left: int, top: int, width: int, height: int) -> Set[int]:
+        found: Set[int] = set()
+        for cell in self._cells_in(left, top, width, height):
+            found |= self._cells.get(cell, set())
+        return found
+
+    def _cells_in(self, left: int, top: int, width: int, height: int) -> Iterator[Tuple[int, int]]:
+        """
+        Yield the (column, row) of every cell touched by a wrapping rectangle.
+        """
+        size = self.cell_size
+        for y, _, h in wrapped_spans(top, height, MAP_HEIGHT):
+            for x, _, w in wrapped_spans(left, width, MAP_WIDTH):
+                for row in range(y // size, (y + h - 1) // size + 1):
+                    for col in range(x // size, (x + w - 1) // size + 1):
+                        yield col, row
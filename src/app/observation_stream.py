@@ -0,0 +1,105 @@
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from src.app.broadcaster import Broadcaster, OverflowPolicy, Subscription, format_sse
+from src.app.models.melvin import melvin, MelvinSnapshot
+from src.app.sim_engine import sim_engine
+
+Observation = Dict[str, Any]
+
+
+class _StreamGroup:
+    """
+    Subscribers sharing one decimation rate, and the observation last sent to them.
+    """
+
+    def __init__(self, every: int) -> None:
+        self.every: int = every
+        # Deltas build on each other, so a reader that falls behind is disconnected instead of skipping some
+        self.broadcaster = Broadcaster(policy=OverflowPolicy.DISCONNECT)
+        self.last_sent: Optional[Observation] = None
+        self.last_step: int = 0
+
+
+class ObservationStream:
+    """
+    Pushes observation deltas to stream subscribers.
+
+    Subscribers are grouped by decimation rate. Each snapshot builds the
+    observation at most once, and each group computes and serializes one
+    delta that its broadcaster hands to all of its subscribers.
+
+    A rate of 0 sends a delta whenever a field other than the timestamp
+    changes. A rate of N sends a delta, including the timestamp, at most
+    once every N sim steps.
+    """
+
+    def __init__(self) -> None:
+        self._groups: Dict[int, _StreamGroup] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, every: int = 0) -> Tuple[str, Subscription]:
+        """
+        Join the group of the given decimation rate.
+
+        Args:
+            every (int): Decimation rate in sim steps, 0 to send on change.
+
+        Returns:
+            Tuple[str, Subscription]: The full current observation as an SSE
+                message, and the subscription receiving the following deltas.
+        """
+        with self._lock:
+            group = self._groups.get(every)
+            if group is None:
+                group = self._groups[every] = _StreamGroup(every)
+            if group.last_sent is None:
+                group.last_sent = dict(melvin.get_observation())
+                group.last_step = melvin.snapshot.sim_steps
+            initial = format_sse(json.dumps(group.last_sent, separators=(",", ":")), event="observation")
+            return initial, group.broadcaster.subscribe()
+
+    def unsubscribe(self, every: int, subscription: Subscription) -> None:
+        with self._lock:
+            group = self._groups.get(every)
+            if group is None:
+                return
+            group.broadcaster.unsubscribe(subscription)
+            if group.broadcaster.subscriber_count == 0:
+                del self._groups[every]
+
+    def on_snapshot(self, snapshot: MelvinSnapshot) -> None:
+        """
+        Send the changes since the last message to every group that is due.
+
+        Args:
+            snapshot (MelvinSnapshot): The snapshot just published.
+        """
+        with self._lock:
+            if not self._groups:
+                return
+            observation: Observation = dict(melvin.get_observation())
+            for group in self._groups.values():
+                if group.every and snapshot.sim_steps - group.last_step < group.every:
+                    continue
+                delta = ObservationStream.diff(group.last_sent or {}, observation)
+                if not delta and not group.every:
+                    continue
+                delta["timestamp"] = observation["timestamp"]
+                group.last_sent = observation
+                group.last_step = snapshot.sim_steps
+                group.broadcaster.publish(json.dumps(delta, separators=(",", ":")), event="delta")
+
+    @staticmethod
+    def diff(old: Observation, new: Observation) -> Observation:
+        """
+        Returns:
+            Observation: Top-level fields of new that differ from old, ignoring the timestamp.
+        """
+        return {key: value for key, value in new.items() if key != "timestamp" and old.get(key) != value}
+
+
+# Singleton instance
+observation_stream = ObservationStream()
+sim_engine.add_listener(observation_stream.on_snapshot)
@@ -1,8 +1,16 @@
 from flask import Blueprint, request, jsonify, Response
 from werkzeug.exceptions import BadRequest
 
+from src.app.chunk_cache import chunk_cache
+from src.app.constants import SIM_STEP_DUR
+from src.app.models.melvin import melvin
+from src.app.sim_engine import sim_engine
+
 bp = Blueprint("palantiri", __name__, url_prefix="/palantiri")
 
+# Upper bound for POST /palantiri/step, one simulated day
+MAX_STEPS_PER_REQUEST: int = int(24 * 3600 / SIM_STEP_DUR)
+
 QUOTE_RESPONSES: dict[str, str] = {
     "The Beacons of Minas Tirith! The Beacons are lit! Gondor calls for aid.":
         "And Rohan will answer!",
@@ -37,3 +45,56 @@ def palantiri_reply() -> Response:
         return jsonify({
             "reply": "The halls of memory are silent... I know not that line."
         })
+
+
+@bp.route("/image_cache", methods=["GET"])
+def image_cache_stats() -> Response:
+    """
+    Report hit/miss counters and occupancy of the encoded /image cache.
+
+    Returns:
+        Response: A JSON object with the cache statistics.
+    """
+    return jsonify(chunk_cache.stats())
+
+
+@bp.route("/step", methods=["POST"])
+def step_simulation() -> Response:
+    """
+    Advance the simulation explicitly. Only available in lockstep mode.
+
+    Query Parameters:
+        n (int): Number of sim steps to advance, 1 to MAX_STEPS_PER_REQUEST, defaults to 1.
+
+    Returns:
+        Response: A JSON object with the number of steps and the new simulation time.
+    """
+    if not sim_engine.lockstep:
+        raise BadRequest("Stepping is only available in lockstep mode.")
+
+    try:
+        n = int(request.args.get("n", "1"))
+    except ValueError:
+        raise BadRequest("'n' must be an integer.")
+    if not 1 <= n <= MAX_STEPS_PER_REQUEST:
+        raise BadRequest(f"'n' must be between 1 and {MAX_STEPS_PER_REQUEST}.")
+
+    sim_engine.step(n)
+    snap = melvin.snapshot
+
+    return jsonify({
+        "steps": n,
+        "sim_duration": snap.sim_duration.total_seconds(),
+        "sim_time": snap.timestamp.isoformat()
+    })
+
+
+@bp.route("/metrics", methods=["GET"])
+def simulation_metrics() -> Response:
+    """
+    Report the tick counters and tick lateness of the simulation engine.
+
+    Returns:
+        Response: A JSON object with the engine metrics.
+    """
+    return jsonify(sim_engine.get_metrics())
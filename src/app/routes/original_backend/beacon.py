@@ -9,9 +9,6 @@ from src.app.models.obj_manager import obj_manager
 
 bp = Blueprint('beacon', __name__)
 
-# Store guess counts: beacon_id, num_guesses
-beacon_guess_tracker: dict[int, int] = {}
-
 
 @bp.route('/beacon', methods=['PUT'])
 def guess_beacon() -> Tuple[Response, int]:
@@ -48,7 +45,7 @@ def guess_beacon() -> Tuple[Response, int]:
 
     BeaconValidation.validate_input_beacon_position(guess_pos)
 
-    beacon = next((b for b in obj_manager.beacon_list if b.id == beacon_id), None)
+    beacon = obj_manager.get_beacon_by_id(beacon_id)
 
     if not beacon:
         return jsonify({
@@ -56,42 +53,36 @@ def guess_beacon() -> Tuple[Response, int]:
             "attempts_made": 0
         }), 404
 
-    beacon_guess_tracker.setdefault(beacon_id, 0)
-
     # Too many attempts already
-    if beacon_guess_tracker[beacon_id] >= 3:
+    if beacon.attempts_made >= 3:
         return jsonify({
             "status": "The beacon could not be found.",
-            "attempts_made": beacon_guess_tracker[beacon_id]
+            "attempts_made": beacon.attempts_made
         }), 200
 
     true_pos = [float(beacon.width), float(beacon.height)]
     guess_pos_float = [float(guess_pos[0]), float(guess_pos[1])]
     distance = Helpers.unwrapped_to(true_pos, guess_pos_float)
+    attempts_made = obj_manager.record_beacon_guess(beacon)
 
     # Successful guess
     if distance <= BEACON_GUESS_TOLERANCE:
-        obj_manager.obj_list.remove(beacon)
-        obj_manager.beacon_list.remove(beacon)
-        beacon_guess_tracker[beacon_id] += 1
+        obj_manager.delete_objective_by_id(beacon.id)
         return jsonify({
             "status": "The beacon was found!",
-            "attempts_made": beacon_guess_tracker[beacon_id]
+            "attempts_made": attempts_made
         }), 200
 
-    # Failed guess
-    beacon_guess_tracker[beacon_id] += 1
-
     # Failed last guess
-    if beacon_guess_tracker[beacon_id] == 3:
+    if attempts_made == 3:
         return jsonify({
             "status": "No more rescue attempts. The beacon has not be found.",
-            "attempts_made": beacon_guess_tracker[beacon_id]
+            "attempts_made": attempts_made
         }), 200
 
     return jsonify({
         "status": "The beacon could not be found.",
-        "attempts_made": beacon_guess_tracker[beacon_id]
+        "attempts_made": attempts_made
     }), 200
 
 
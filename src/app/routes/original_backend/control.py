@@ -5,8 +5,9 @@ from flask import Blueprint, request, jsonify, Response
 
 from src.app.constants import MIN_ALLOWED_VEL, MAX_ALLOWED_VEL, SatStates, CameraAngle, MAX_ALLOWED_VEL_ANGLE
 from src.app.helpers import Helpers
-from src.app.models.melvin import melvin
-from werkzeug.exceptions import BadRequest
+from src.app.models.melvin import melvin, MelvinSnapshot
+from src.app.sim_engine import sim_engine
+from werkzeug.exceptions import BadRequest, ServiceUnavailable
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,9 @@ def control() -> Tuple[Response, int]:
       - camera_angle (str)
       - state (str)
 
+    Validation runs against the latest Melvin snapshot; accepted changes are
+    applied by the simulation thread before the response is sent.
+
     Returns:
         JSON response indicating update status or validation errors.
     """
@@ -35,13 +39,15 @@ def control() -> Tuple[Response, int]:
         if not all(field in data for field in required_fields):
             raise BadRequest("Missing required control fields.")
 
-        safe_mode_block = (melvin.state is SatStates.SAFE and melvin.bat < 10.0)
+        snap = melvin.snapshot
+        safe_mode_block = (snap.state is SatStates.SAFE and snap.bat < 10.0)
 
-        if melvin.state.value != data[
-            "state"] and melvin.state_target is not SatStates.TRANSITION and not safe_mode_block:
+        if snap.state.value != data[
+            "state"] and snap.state_target is not SatStates.TRANSITION and not safe_mode_block:
             try:
-                ControlValidation.validate_input_state(data["state"])
-                melvin.update_state(state=data["state"])
+                ControlValidation.validate_input_state(snap, data["state"])
+                target_state = data["state"]
+                sim_engine.execute(lambda: melvin.update_state(state=target_state))
                 response["status"] = "Target state updated successfully."
             except BadRequest as e:
                 response["error"] = str(e)
@@ -53,22 +59,25 @@ def control() -> Tuple[Response, int]:
             assert isinstance(data["vel_x"], float) and isinstance(data["vel_y"], float)
 
             ControlValidation.validate_input_angle(data["camera_angle"])
-            ControlValidation.validate_input_velocity([data["vel_x"], data["vel_y"]])
-
-            if SatStates(melvin.state) == SatStates.ACQUISITION:
-                melvin.update_control(
-                    vel_x=data["vel_x"],
-                    vel_y=data["vel_y"],
-                    camera_angle=data["camera_angle"],
-                )
+            ControlValidation.validate_input_velocity(snap, [data["vel_x"], data["vel_y"]])
+
+            if SatStates(snap.state) == SatStates.ACQUISITION:
+                vel_x, vel_y, camera_angle = data["vel_x"], data["vel_y"], data["camera_angle"]
+
+                def apply_control() -> None:
+                    if melvin.state == SatStates.ACQUISITION:
+                        melvin.update_control(vel_x=vel_x, vel_y=vel_y, camera_angle=camera_angle)
+
+                sim_engine.execute(apply_control)
             else:
                 logger.warning("Cant change velocity and angle when not in acquisition")
 
+            snap = melvin.snapshot
             response["status"] = "Control values updated successfully."
-            response["vel_x"] = melvin.vel[0]
-            response["vel_y"] = melvin.vel[1]
-            response["camera_angle"] = melvin.camera_angle.value
-            response["state"] = melvin.state.value
+            response["vel_x"] = snap.vel[0]
+            response["vel_y"] = snap.vel[1]
+            response["camera_angle"] = snap.camera_angle.value
+            response["state"] = snap.state.value
         except BadRequest as e:
             response["error"] = str(e)
             status_code = 400
@@ -80,6 +89,8 @@ def control() -> Tuple[Response, int]:
 
     except ValueError as e:
         raise BadRequest(f"Invalid value: {e}")
+    except TimeoutError:
+        raise ServiceUnavailable("Simulation did not apply the control update in time.")
 
 
 class ControlValidation:
@@ -88,7 +99,7 @@ class ControlValidation:
     """
 
     @staticmethod
-    def validate_input_state(input_state: str) -> None:
+    def validate_input_state(snap: MelvinSnapshot, input_state: str) -> None:
         """
         Validate that the given state is a legal target state.
 
@@ -100,7 +111,7 @@ class ControlValidation:
 
         desired_state = SatStates(input_state)
 
-        if melvin.state == SatStates.TRANSITION:
+        if snap.state == SatStates.TRANSITION:
             raise BadRequest("Target state cannot be set during transition.")
 
         if desired_state == SatStates.DEPLOYMENT:
@@ -121,17 +132,17 @@ class ControlValidation:
             raise BadRequest("Invalid camera angle.")
 
     @staticmethod
-    def validate_input_velocity(input_vel: list[float]) -> None:
+    def validate_input_velocity(snap: MelvinSnapshot, input_vel: list[float]) -> None:
         """
         Validate velocity vector is within bounds and not too sharp a turn.
 
         Raises:
             BadRequest: If velocity violates constraints.
         """
-        if input_vel[0] == melvin.vel[0] and input_vel[1] == melvin.vel[1]:
+        if input_vel[0] == snap.vel[0] and input_vel[1] == snap.vel[1]:
             return
 
-        angle = Helpers.angle_between(melvin.vel, input_vel)
+        angle = Helpers.angle_between(list(snap.vel), input_vel)
         if angle >= MAX_ALLOWED_VEL_ANGLE:
             raise BadRequest(
                 f"Velocity out of bounds. Angle between new and old velocity must be less than {MAX_ALLOWED_VEL_ANGLE} degrees.")
@@ -2,9 +2,9 @@ import logging
 from typing import Tuple
 
 from flask import Blueprint, request, jsonify, Response, make_response
-from PIL import Image, ImageChops
+from PIL import Image
 
-from src.app.image_loader import get_full_map
+from src.app.map_scoring import score_daily_map
 
 bp = Blueprint('dailyMap', __name__)
 
@@ -15,10 +15,10 @@ def upload_daily_map() -> Tuple[Response, int]:
     Handle POST upload of a daily map image and compare it with the original.
 
     Expects:
-        A multipart/form-data request with an 'image' field.
+        A multipart/form-data request with an 'image' field holding a MAP_WIDTH x MAP_HEIGHT image.
 
     Returns:
-        Tuple[dict, int]: JSON response and HTTP status code.
+        Tuple[dict, int]: JSON response with the global and per-tile mean difference, and HTTP status code.
     """
     try:
         uploaded_file = request.files.get('image')
@@ -27,14 +27,19 @@ def upload_daily_map() -> Tuple[Response, int]:
 
         file_stream = uploaded_file.stream
         uploaded_img = Image.open(file_stream)
-        original_map = get_full_map()
-
-        diff = ImageChops.difference(uploaded_img, original_map)
-        mean_diff = sum(list(diff.getdata())) / (uploaded_img.width * uploaded_img.height * 3)
+        try:
+            score = score_daily_map(uploaded_img)
+        except ValueError as e:
+            return make_response({"error": str(e)}), 400
 
         logger = logging.getLogger(__name__)
-        logger.info(f"Daily Map submitted. Mean difference: {mean_diff}")
-
-        return make_response(jsonify("upload successful")), 200
+        logger.info(f"Daily Map submitted. Mean difference: {score.mean_difference}")
+
+        return make_response(jsonify({
+            "status": "upload successful",
+            "mean_difference": round(score.mean_difference, 3),
+            "tile_size": score.tile_size,
+            "tile_scores": score.tile_scores,
+        })), 200
     except Exception as e:
         return make_response({"error": f"An error occurred: {str(e)}"}), 500
@@ -1,7 +1,11 @@
-from typing import Tuple
+from typing import Tuple, Optional
 
-from flask import Blueprint, send_file, Response, make_response
-from src.app.image_loader import get_map_chunk
+from flask import Blueprint, send_file, Response, make_response, request
+from werkzeug.exceptions import BadRequest
+
+from src.app.chunk_cache import chunk_cache
+from src.app.constants import ImageFormat
+from src.app.image_loader import get_map_chunk, map_store, ChunkEncoding
 from src.app.models.melvin import melvin
 import io
 
@@ -12,15 +16,84 @@ bp = Blueprint('image', __name__)
 def get_image() -> tuple[Response, int]:
     """
     Return a cropped map image based on Melvin's position and camera angle.
+    Encoded chunks are served from the chunk cache while the map is unchanged.
+
+    Query Parameters:
+        format (str): Optional. One of png, webp, jpeg or raw. Overrides the Accept header.
+        quality (int): Optional. 1-100, used by webp and jpeg.
+        compress_level (int): Optional. 0-9, used by png.
 
     Returns:
-        Response: PNG image stream or JSON error message with status code.
+        Response: Encoded image stream (PNG by default) or JSON error message with status code.
     """
+    encoding = ImageValidation.parse_encoding()
     try:
-        melvin_pos: Tuple[int, int] = (round(melvin.pos[0]), round(melvin.pos[1]))
-        angle = melvin.camera_angle
-        img = get_map_chunk(melvin_pos, angle.get_side_length())
+        snap = melvin.snapshot
+        melvin_pos: Tuple[int, int] = (round(snap.pos[0]), round(snap.pos[1]))
+        angle = snap.camera_angle
+        img = chunk_cache.get_or_encode(
+            (melvin_pos[0], melvin_pos[1], angle, map_store.version, encoding),
+            lambda: get_map_chunk(melvin_pos, angle.get_side_length(), encoding)
+        )
+        melvin.record_image(snap, melvin_pos)
         img_stream = io.BytesIO(img)
-        return send_file(img_stream, mimetype='image/png'), 200
+        return send_file(img_stream, mimetype=encoding.image_format.get_mimetype()), 200
     except Exception as e:
         return make_response({"error": f"An error occurred: {str(e)}"}), 500
+
+
+class ImageValidation:
+    """
+    Helper class to validate the requested image encoding.
+    """
+
+    @staticmethod
+    def parse_encoding() -> ChunkEncoding:
+        """
+        Build the chunk encoding from the query string, falling back to the Accept header.
+
+        Returns:
+            ChunkEncoding: The requested encoding, PNG with default settings if unspecified.
+
+        Raises:
+            BadRequest: If the format or a compression knob is invalid.
+        """
+        requested: Optional[str] = request.args.get("format")
+        if requested is not None:
+            requested = requested.lower().replace("jpg", "jpeg")
+            if not ImageFormat.is_valid_image_format(requested):
+                raise BadRequest(f"Invalid image format. Use one of {[f.value for f in ImageFormat]}.")
+            image_format = ImageFormat(requested)
+        else:
+            best = request.accept_mimetypes.best_match(
+                [f.get_mimetype() for f in ImageFormat], default=ImageFormat.PNG.get_mimetype()
+            )
+            image_format = next(f for f in ImageFormat if f.get_mimetype() == best)
+
+        quality = ImageValidation.parse_bounded_int("quality", 1, 100)
+        compress_level = ImageValidation.parse_bounded_int("compress_level", 0, 9)
+
+        return ChunkEncoding(
+            image_format=image_format,
+            quality=quality if image_format in (ImageFormat.WEBP, ImageFormat.JPEG) else None,
+            compress_level=compress_level if image_format == ImageFormat.PNG else None,
+        )
+
+    @staticmethod
+    def parse_bounded_int(name: str, minimum: int, maximum: int) -> Optional[int]:
+        """
+        Read an optional integer query parameter within bounds.
+
+        Raises:
+            BadRequest: If the value is not an integer or out of bounds.
+        """
+        raw = request.args.get(name)
+        if raw is None:
+            return None
+        try:
+            value = int(raw)
+        except ValueError:
+            raise BadRequest(f"'{name}' must be an integer.")
+        if not minimum <= value <= maximum:
+            raise BadRequest(f"'{name}' must be between {minimum} and {maximum}.")
+        return value
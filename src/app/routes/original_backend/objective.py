@@ -1,4 +1,5 @@
-from typing import Optional, Any
+import io
+from typing import Optional, Any, cast
 
 from flask import Blueprint, request, jsonify, Response
 from werkzeug.exceptions import BadRequest
@@ -6,19 +7,38 @@ from werkzeug.exceptions import BadRequest
 from src.app.models.obj_beacon import BeaconObjective, BeaconObjectiveDict
 from src.app.models.obj_manager import obj_manager
 from src.app.models.obj_zoned import ZonedObjective, ZonedObjectiveDict
+from src.app.models.scenario_import import import_ndjson
+from src.app.sim_clock import sim_clock
 
 bp = Blueprint('objective', __name__)
 
+# Read buffer (bytes) for streamed NDJSON imports
+IMPORT_READ_BUFFER: int = 64 * 1024
+
 
 @bp.route('/objective', methods=['GET'])
 def objective() -> Response:
     """
     Retrieve all active objectives (zoned and beacon).
 
+    The body is served from the objective manager's cache and tagged with its
+    version as ETag; a matching If-None-Match gets an empty 304. The ETag is
+    prefixed with the simulation start time, so tags from a previous process
+    never match.
+
     Returns:
         JSON: A dictionary containing lists of objectives.
     """
-    return jsonify(obj_manager.get_all_objectives())
+    version, body = obj_manager.get_objectives_payload()
+    etag = f"{sim_clock.start_time.timestamp():.6f}-{version}"
+
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype="application/json")
+        response.headers["Cache-Control"] = "no-cache"
+    response.set_etag(etag)
+    return response
 
 
 @bp.route('/objective', methods=['PUT'])
@@ -82,6 +102,26 @@ def add_objectives() -> tuple[Response, int]:
     return jsonify(responses), 201
 
 
+@bp.route('/objective/import', methods=['POST'])
+def import_objectives() -> tuple[Response, int]:
+    """
+    Bulk import objectives from an NDJSON body, one objective per line.
+
+    Each line holds a manual objective as in PUT /objective plus a "type"
+    field ("zoned" or "beacon"). Invalid records are reported by line number
+    and skipped; all valid objectives are stored together.
+
+    Returns:
+        Tuple[JSON, int]: Import summary with per-record errors.
+    """
+    # request.stream reads lines byte by byte; buffer it so large scenarios stream quickly
+    result = import_ndjson(io.BufferedReader(cast(io.RawIOBase, request.stream), IMPORT_READ_BUFFER))
+    if not result.imported_ids and not result.errors:
+        raise BadRequest("No objectives submitted.")
+
+    return jsonify(result.to_dict()), 201 if result.imported_ids else 400
+
+
 @bp.route('/', methods=['DELETE'])
 def delete_objective() -> tuple[Response, int]:
     """
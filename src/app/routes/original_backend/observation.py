@@ -1,10 +1,94 @@
-from typing import Tuple
+from typing import Generator, Optional, Tuple, cast
 
-from flask import Blueprint, jsonify, Response
+from flask import Blueprint, Response, current_app, request
+from werkzeug.exceptions import BadRequest
+
+from src.app.broadcaster import STREAM_KEEPALIVE
 from src.app.models.melvin import melvin
+from src.app.observation_stream import observation_stream
+from src.app.sim_clock import sim_clock
 
 bp = Blueprint('observation', __name__)
 
+# (etag, serialized body) of the last observation built
+_cached: Optional[Tuple[str, bytes]] = None
+
+
+def _observation_etag(seq: int, images_taken: int) -> str:
+    return f"{sim_clock.start_time.timestamp():.6f}-{seq}-{images_taken}"
+
+
 @bp.route('/observation', methods=['GET'])
 def get_observation() -> Tuple[Response, int]:
-    return jsonify(melvin.get_observation()), 200
+    """
+    Return Melvin's current telemetry.
+
+    The JSON body is serialized once per published snapshot (and per image
+    taken, since coverage is part of the observation) and tagged with an ETag
+    that starts with the simulation start time, so it is unique per process.
+    ETag and body are built from the same snapshot and image count, so a tag
+    always describes the body it was sent with. Pollers sending a matching
+    If-None-Match get an empty 304.
+
+    Returns:
+        Tuple[Response, int]: Observation JSON, or an empty 304 response.
+    """
+    global _cached
+    snap = melvin.snapshot
+    etag = _observation_etag(snap.seq, melvin.coverage.images_taken)
+
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response, 304
+
+    cached = _cached
+    if cached is None or cached[0] != etag:
+        observation = melvin.get_observation(snap)
+        # An image taken since the count above was read is already in the body; tag the body with its own count
+        etag = _observation_etag(snap.seq, cast(int, observation["images_taken"]))
+        body = (current_app.json.dumps(observation) + "\n").encode()
+        cached = _cached = (etag, body)
+
+    response = Response(cached[1], mimetype="application/json")
+    response.set_etag(cached[0])
+    response.headers["Cache-Control"] = "no-cache"
+    return response, 200
+
+
+@bp.route('/observation/stream', methods=['GET'])
+def stream_observation() -> Response:
+    """
+    Server-Sent Events stream of Melvin's telemetry.
+
+    The first event ("observation") carries the full observation, every
+    following event ("delta") only the fields that changed plus the timestamp.
+    A client that falls too far behind is disconnected and has to reconnect.
+
+    Query Parameters:
+        every (int): Optional. Send at most one delta every N sim steps instead of on every change.
+
+    Returns:
+        Response: A streaming HTTP response with `text/event-stream` MIME type.
+    """
+    try:
+        every = int(request.args.get("every", 0))
+    except ValueError:
+        raise BadRequest("'every' must be an integer.")
+    if every < 0:
+        raise BadRequest("'every' must not be negative.")
+
+    initial, subscription = observation_stream.subscribe(every)
+
+    def event_stream() -> Generator[str, None, None]:
+        try:
+            yield initial
+            while True:
+                message = subscription.get(timeout=STREAM_KEEPALIVE)
+                if subscription.closed:
+                    return
+                yield message if message is not None else ": keepalive\n\n"
+        finally:
+            observation_stream.unsubscribe(every, subscription)
+
+    return Response(event_stream(), mimetype='text/event-stream', headers={"Cache-Control": "no-cache"})
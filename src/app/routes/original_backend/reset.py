@@ -1,5 +1,7 @@
 from flask import Blueprint, jsonify, Response, make_response
+from werkzeug.exceptions import ServiceUnavailable
 from src.app.models.melvin import melvin
+from src.app.sim_engine import sim_engine
 
 bp = Blueprint('reset', __name__)
 
@@ -12,5 +14,8 @@ def reset() -> tuple[Response, int]:
     Returns:
         Response: JSON confirmation and HTTP 200 status code.
     """
-    melvin.reset()
+    try:
+        sim_engine.execute(melvin.reset)
+    except TimeoutError:
+        raise ServiceUnavailable("Simulation did not apply the reset in time.")
     return make_response( jsonify("Reset the engine successfully.")), 200
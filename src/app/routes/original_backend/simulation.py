@@ -0,0 +1,39 @@
+from typing import Tuple
+
+from flask import Blueprint, request, jsonify, Response
+from werkzeug.exceptions import BadRequest, ServiceUnavailable
+
+from src.app.constants import MAX_SIMULATION_SPEED
+from src.app.models.melvin import melvin
+from src.app.sim_engine import sim_engine
+
+bp = Blueprint('simulation', __name__)
+
+
+@bp.route('/simulation', methods=['PUT'])
+def configure_simulation() -> Tuple[Response, int]:
+    """
+    Change the simulation speed at runtime.
+
+    Query Parameters:
+        user_speed_multiplier (int): Simulated seconds per wall-clock second, 1 to MAX_SIMULATION_SPEED.
+        is_network_simulation (bool): Accepted for compatibility, network simulation is not modeled.
+
+    Returns:
+        JSON: The applied simulation settings.
+    """
+    speed = request.args.get("user_speed_multiplier", type=int)
+    if speed is None:
+        raise BadRequest("Missing or non-integer 'user_speed_multiplier' query parameter.")
+    if not 1 <= speed <= MAX_SIMULATION_SPEED:
+        raise BadRequest(f"'user_speed_multiplier' must be between 1 and {MAX_SIMULATION_SPEED}.")
+
+    try:
+        sim_engine.execute(lambda: melvin.set_simulation_speed(speed))
+    except TimeoutError:
+        raise ServiceUnavailable("Simulation did not apply the new speed in time.")
+
+    return jsonify({
+        "is_network_simulation": False,
+        "user_speed_multiplier": melvin.snapshot.simulation_speed
+    }), 200
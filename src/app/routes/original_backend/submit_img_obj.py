@@ -3,6 +3,7 @@ from PIL import Image
 import logging
 
 from src.app.models.obj_manager import obj_manager
+from src.app.models.obj_zoned import ZonedObjective
 from src.app.routes.original_backend.get_image import bp
 
 
@@ -10,7 +11,9 @@ from src.app.routes.original_backend.get_image import bp
 def submit_img_obj() -> tuple[object, int]:
     """
     Handle a submitted image for a specific objective.
-    (Future: Compare the submitted image to the expected one.)
+
+    Zoned objectives are accepted once the images served with the required optic
+    cover at least `coverage_required` of the zone.
 
     Query Params:
         objective_id (int): The ID of the objective being submitted.
@@ -29,14 +32,23 @@ def submit_img_obj() -> tuple[object, int]:
 
         file_stream = uploaded_file.stream
         uploaded_img = Image.open(file_stream)
-        #actual_img = obj_manager.get_obj_img(obj_id)
 
-        #diff = ImageChops.difference(uploaded_img, actual_img)
-        #mean_diff = sum(list(diff.getdata())) / (actual_img.width * actual_img.height * 3)
+        objective = obj_manager.get_objective_by_id(obj_id)
+        if objective is None:
+            return {"error": f"Objective with ID {obj_id} not found."}, 404
 
-        obj_manager.delete_objective_by_id(obj_id)
         logger = logging.getLogger(__name__)
-        logger.info(f"Objective {obj_id} submitted. Mean difference: not computed yet")
+        if isinstance(objective, ZonedObjective):
+            coverage = objective.coverage.fraction()
+            if coverage < objective.coverage_required:
+                logger.info(f"Objective {obj_id} rejected. Coverage: {coverage:.4f}")
+                return {"error": f"Zone coverage {coverage:.2%} is below the required "
+                                 f"{objective.coverage_required:.2%}."}, 400
+            logger.info(f"Objective {obj_id} submitted. Coverage: {coverage:.4f}")
+        else:
+            logger.info(f"Objective {obj_id} submitted.")
+
+        obj_manager.delete_objective_by_id(obj_id)
         return jsonify("received objective"), 200
     except Exception as e:
         return {"error": f"An error occurred: {str(e)}"}, 500
@@ -1,23 +1,32 @@
-from datetime import datetime, timedelta
-import threading
+from datetime import datetime, timedelta, timezone
+
+from src.app.constants import SIM_STEP_DUR
+
 
 class SimulationClock:
-    def __init__(self, start_time: datetime):
-        self.sim_time = start_time
-        self._tick_rate = timedelta(seconds=1)  # real-time = 1s per tick
-        self._advance_per_tick = timedelta(seconds=1)  # 1s of sim time per tick
+    """
+    Simulation time, counted in whole sim steps since the start time.
 
-    def start(self) -> None:
-        def run() -> None:
-            while True:
-                self.sim_time += self._advance_per_tick
-                threading.Event().wait(self._tick_rate.total_seconds())
+    The clock has no thread of its own; it is advanced only by the simulation
+    engine, in the same batch as the physics, so announcements, objectives
+    and Melvin all see one timeline.
+    """
 
-        threading.Thread(target=run, daemon=True).start()
+    def __init__(self, start_time: datetime):
+        self.start_time = start_time
+        self.steps: int = 0
 
     def get_time(self) -> datetime:
-        return self.sim_time
+        return self.start_time + timedelta(seconds=self.steps * SIM_STEP_DUR)
+
+    def advance_steps(self, n: int) -> None:
+        """
+        Advance the simulation time by a number of sim steps.
+
+        Args:
+            n (int): Number of sim steps.
+        """
+        self.steps += n
 
 # Singleton instance
-sim_clock = SimulationClock(start_time=datetime.now())
-sim_clock.start()
+sim_clock = SimulationClock(start_time=datetime.now(timezone.utc))
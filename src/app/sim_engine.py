@@ -0,0 +1,248 @@
+import os
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Tuple, Union
+
+from src.app.constants import SIM_STEP_DUR
+from src.app.models.melvin import melvin, MelvinSnapshot
+from src.app.models.obj_manager import obj_manager
+from src.app.sim_clock import sim_clock
+
+logger = logging.getLogger(__name__)
+
+# Seconds a request thread waits for the simulation thread to apply a command
+COMMAND_TIMEOUT: float = 5.0
+
+
+class SimulationEngine:
+    """
+    Owns the simulation timeline and drives Melvin, the simulation clock and
+    the objective schedule from it.
+
+    In real-time mode a single background thread advances the simulation
+    every SIM_STEP_DUR seconds of wall time, scheduled against
+    `time.monotonic()`. Ticks that were missed (e.g. under load) are caught up
+    in one batch instead of being dropped, so simulation time does not drift.
+    In lockstep mode no thread is started and simulation time only moves
+    through `step`, which makes runs as fast as the CPU allows and exactly
+    reproducible.
+
+    State changes requested by request threads are submitted as commands. The
+    simulation thread applies them between steps and publishes a new Melvin
+    snapshot, so readers never wait on the updater. Listeners registered with
+    `add_listener` are called on the simulation thread with every snapshot.
+    """
+
+    def __init__(self) -> None:
+        self.lockstep: bool = False
+        self._started: bool = False
+        self._threaded: bool = False
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._commands: "queue.SimpleQueue[Tuple[Callable[[], None], Future[None]]]" = queue.SimpleQueue()
+        self._listeners: List[Callable[[MelvinSnapshot], None]] = []
+
+        self.ticks: int = 0
+        self.late_ticks: int = 0
+        self.caught_up_ticks: int = 0
+        self.last_lateness: float = 0.0
+        self.max_lateness: float = 0.0
+
+    def start(self, lockstep: bool = False) -> None:
+        """
+        Start the simulation in the given mode. Later calls are no-ops.
+
+        Args:
+            lockstep (bool): Disable the background thread and advance only through `step`.
+        """
+        if self._started:
+            return
+        self._started = True
+        self.lockstep = lockstep
+        obj_manager.advance_time(sim_clock.get_time())
+
+        if lockstep:
+            logger.info("Simulation running in lockstep mode.")
+            return
+
+        self._threaded = True
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def add_listener(self, listener: Callable[[MelvinSnapshot], None]) -> None:
+        """
+        Register a callback for every published snapshot.
+
+        Listeners run on the simulation thread while it holds the engine lock,
+        so they must be quick and must not submit commands.
+
+        Args:
+            listener (Callable[[MelvinSnapshot], None]): Called with each new snapshot.
+        """
+        self._listeners.append(listener)
+
+    def submit(self, command: Callable[[], None]) -> "Future[None]":
+        """
+        Queue a state change for the simulation thread.
+
+        Without a simulation thread (lockstep mode or not started) the command
+        is applied right away.
+
+        Args:
+            command (Callable[[], None]): Mutates Melvin or other simulation state.
+
+        Returns:
+            Future[None]: Resolved once the command is applied and a new snapshot is published.
+        """
+        future: Future[None] = Future()
+        if not self._threaded:
+            with self._lock:
+                self._apply(command, future)
+                self._publish()
+            return future
+
+        self._commands.put((command, future))
+        self._wakeup.set()
+        return future
+
+    def execute(self, command: Callable[[], None]) -> None:
+        """
+        Submit a command and wait until it is applied.
+
+        Args:
+            command (Callable[[], None]): Mutates Melvin or other simulation state.
+
+        Raises:
+            TimeoutError: If the command is not applied within COMMAND_TIMEOUT seconds.
+        """
+        self.submit(command).result(timeout=COMMAND_TIMEOUT)
+
+    def step(self, n: int = 1) -> None:
+        """
+        Advance the simulation by a number of sim steps.
+
+        Args:
+            n (int): Number of sim steps of SIM_STEP_DUR seconds.
+
+        Raises:
+            RuntimeError: If the engine is not in lockstep mode.
+        """
+        if not self.lockstep:
+            raise RuntimeError("Explicit stepping is only available in lockstep mode.")
+        self._advance(n)
+
+    def get_metrics(self) -> Dict[str, Union[int, float]]:
+        """
+        Returns:
+            Dict[str, Union[int, float]]: Tick counters and lateness (seconds) of the real-time loop.
+        """
+        return {
+            "sim_steps": sim_clock.steps,
+            "ticks": self.ticks,
+            "late_ticks": self.late_ticks,
+            "caught_up_ticks": self.caught_up_ticks,
+            "last_lateness": round(self.last_lateness, 6),
+            "max_lateness": round(self.max_lateness, 6),
+        }
+
+    def _advance(self, n: int) -> None:
+        """
+        Apply pending commands, advance physics, clock and objective schedule
+        together by a number of sim steps and publish the resulting snapshot.
+        """
+        with self._lock:
+            self._drain_commands()
+            if n > 0:
+                melvin.advance(n * SIM_STEP_DUR)
+                sim_clock.advance_steps(n)
+                obj_manager.advance_time(sim_clock.get_time())
+            self._publish()
+
+    def _publish(self) -> None:
+        """
+        Publish a new Melvin snapshot and notify the listeners. Called with the lock held.
+        """
+        snapshot = melvin.publish_snapshot()
+        for listener in self._listeners:
+            try:
+                listener(snapshot)
+            except Exception:
+                logger.exception("Snapshot listener failed.")
+
+    def _drain_commands(self) -> bool:
+        """
+        Apply all queued commands in submission order.
+
+        Returns:
+            bool: True if any command was applied.
+        """
+        applied = False
+        while True:
+            try:
+                command, future = self._commands.get_nowait()
+            except queue.Empty:
+                return applied
+            self._apply(command, future)
+            applied = True
+
+    @staticmethod
+    def _apply(command: Callable[[], None], future: "Future[None]") -> None:
+        try:
+            command()
+            future.set_result(None)
+        except Exception as e:
+            logger.exception("Simulation command failed.")
+            future.set_exception(e)
+
+    def _run(self) -> None:
+        """
+        Real-time loop. Every wall-clock tick advances `simulation_speed` sim steps.
+
+        A failing tick is logged and skipped, so the thread keeps serving
+        commands instead of dying silently.
+        """
+        origin = time.monotonic()
+        while True:
+            self._wakeup.clear()
+            try:
+                self._tick(origin)
+            except Exception:
+                logger.exception("Simulation tick failed.")
+
+            self._wakeup.wait(max(0.0, origin + self.ticks * SIM_STEP_DUR - time.monotonic()))
+
+    def _tick(self, origin: float) -> None:
+        """
+        Advance by all ticks due since `origin`, or only apply pending commands if none are due.
+        """
+        now = time.monotonic()
+        # All ticks whose scheduled time has passed are due, not just the next one
+        due = int((now - origin) / SIM_STEP_DUR) + 1 - self.ticks
+        if due > 0:
+            lateness = now - (origin + self.ticks * SIM_STEP_DUR)
+            self.last_lateness = lateness
+            self.max_lateness = max(self.max_lateness, lateness)
+            if due > 1:
+                self.late_ticks += 1
+                self.caught_up_ticks += due - 1
+
+            # Counted before advancing, so a failing step is not retried with an ever larger batch
+            self.ticks += due
+            self._advance(due * melvin.simulation_speed)
+        elif not self._commands.empty():
+            # Woken up by a command: apply it without advancing time
+            self._advance(0)
+
+
+def lockstep_from_env() -> bool:
+    """
+    Returns:
+        bool: True if PALANTIRI_LOCKSTEP is set to a truthy value.
+    """
+    return os.environ.get("PALANTIRI_LOCKSTEP", "").lower() in ("1", "true", "yes")
+
+
+# Singleton instance
+sim_engine = SimulationEngine()
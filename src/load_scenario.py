@@ -0,0 +1,66 @@
+"""
+Load an NDJSON scenario file into a running Palantiri instance.
+
+Usage:
+    python -m src.load_scenario scenario.ndjson [--url http://localhost:5000]
+
+Every line of the file is one objective as accepted by PUT /objective, with
+an additional "type" field ("zoned" or "beacon"). The file is streamed to
+POST /objective/import; records that fail are listed with their line number.
+"""
+import argparse
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+from typing import Any, Dict, List, Optional
+
+
+def load_scenario(path: str, url: str) -> Dict[str, Any]:
+    """
+    Stream a scenario file to the bulk import endpoint.
+
+    Args:
+        path (str): Path of the NDJSON file.
+        url (str): Base URL of the Palantiri API.
+
+    Returns:
+        Dict[str, Any]: The import summary returned by the server.
+    """
+    with open(path, "rb") as scenario:
+        request = urllib.request.Request(
+            f"{url.rstrip('/')}/objective/import",
+            data=scenario,
+            method="POST",
+            headers={
+                "Content-Type": "application/x-ndjson",
+                "Content-Length": str(os.path.getsize(path)),
+            },
+        )
+        try:
+            with urllib.request.urlopen(request) as response:
+                result: Dict[str, Any] = json.load(response)
+        except urllib.error.HTTPError as e:
+            # A 400 with a JSON body means nothing was imported, but it still lists the errors
+            if e.code != 400 or e.headers.get_content_type() != "application/json":
+                raise
+            result = json.load(e)
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk import objectives from an NDJSON scenario file.")
+    parser.add_argument("path", help="NDJSON file, one objective per line")
+    parser.add_argument("--url", default="http://localhost:5000", help="Base URL of the Palantiri API")
+    args = parser.parse_args(argv)
+
+    result = load_scenario(args.path, args.url)
+    for error in result.get("errors", []):
+        print(f"line {error['line']}: {error['error']}", file=sys.stderr)
+    print(f"Imported {result.get('imported', 0)} objectives, {result.get('failed', 0)} failed.")
+    return 0 if not result.get("failed") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())